@@ -1,37 +1,158 @@
 # config.py
+import logging
 import os
+import threading
+from functools import lru_cache
 from dotenv import load_dotenv
 
-load_dotenv()
+_log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """Parse the .env file once per process; repeated calls are no-ops."""
+    return load_dotenv()
+
+
+load_env()
+
+
+class _Config:
+    """Snapshot of the environment taken once after `load_dotenv()`."""
+
+    __slots__ = (
+        'DEFAULT_LLM_PROVIDER',
+        'DEFAULT_LLM_MODEL',
+        'ANTHROPIC_API_KEY',
+        'ANTHROPIC_DEFAULT_MODEL',
+        'OPENAI_API_KEY',
+        'OPENAI_DEFAULT_MODEL',
+        'AZURE_OPENAI_API_KEY',
+        'AZURE_OPENAI_ENDPOINT',
+        'AZURE_OPENAI_API_VERSION',
+        'AZURE_OPENAI_DEPLOYMENT_NAME',
+        'LANGCHAIN_TRACING_V2',
+        'LANGCHAIN_API_KEY',
+        'LANGCHAIN_PROJECT',
+        'LANGCHAIN_ENDPOINT',
+        'SEMANTIC_CACHE_ENABLED',
+        'SEMANTIC_CACHE_THRESHOLD',
+        'SEMANTIC_CACHE_TTL',
+    )
+
+    def __init__(self, env):
+        # ==================== LLM Provider Configuration ====================
+
+        # Default LLM Provider: "anthropic", "openai", or "azure"
+        self.DEFAULT_LLM_PROVIDER = env.get('DEFAULT_LLM_PROVIDER', 'anthropic')
+
+        # Default model for each provider (can be overridden via environment variables)
+        self.DEFAULT_LLM_MODEL = env.get('DEFAULT_LLM_MODEL', 'claude-sonnet-4-20250514')
+
+        # ==================== Anthropic Configuration ====================
+        self.ANTHROPIC_API_KEY = env.get('ANTHROPIC_API_KEY')
+        self.ANTHROPIC_DEFAULT_MODEL = env.get('ANTHROPIC_DEFAULT_MODEL', 'claude-sonnet-4-20250514')
+
+        # ==================== OpenAI Configuration ====================
+        self.OPENAI_API_KEY = env.get('OPENAI_API_KEY')
+        self.OPENAI_DEFAULT_MODEL = env.get('OPENAI_DEFAULT_MODEL', 'gpt-4-turbo')
+
+        # ==================== Azure OpenAI Configuration ====================
+        self.AZURE_OPENAI_API_KEY = env.get('AZURE_OPENAI_API_KEY')
+        self.AZURE_OPENAI_ENDPOINT = env.get('AZURE_OPENAI_ENDPOINT')
+        self.AZURE_OPENAI_API_VERSION = env.get('AZURE_OPENAI_API_VERSION', '2024-02-15-preview')
+        self.AZURE_OPENAI_DEPLOYMENT_NAME = env.get('AZURE_OPENAI_DEPLOYMENT_NAME')
+
+        # ==================== LangSmith Configuration ====================
+        # Enable LangSmith tracing for monitoring and debugging
+        self.LANGCHAIN_TRACING_V2 = env.get('LANGCHAIN_TRACING_V2', 'false').lower() == 'true'
+        self.LANGCHAIN_API_KEY = None
+        self.LANGCHAIN_PROJECT = 'contract-draft-poc'
+        self.LANGCHAIN_ENDPOINT = 'https://api.smith.langchain.com'
+        # Remaining LangSmith settings only matter when tracing is enabled
+        if self.LANGCHAIN_TRACING_V2:
+            self.LANGCHAIN_API_KEY = env.get('LANGCHAIN_API_KEY')
+            self.LANGCHAIN_PROJECT = env.get('LANGCHAIN_PROJECT', self.LANGCHAIN_PROJECT)
+            self.LANGCHAIN_ENDPOINT = env.get('LANGCHAIN_ENDPOINT', self.LANGCHAIN_ENDPOINT)
+
+        # ==================== Semantic Cache Configuration ====================
+        # Reuse section texts for near-identical prompts (needs sentence-transformers)
+        self.SEMANTIC_CACHE_ENABLED = env.get('SEMANTIC_CACHE_ENABLED', 'false').lower() == 'true'
+        self.SEMANTIC_CACHE_THRESHOLD = float(env.get('SEMANTIC_CACHE_THRESHOLD', '0.92'))
+        self.SEMANTIC_CACHE_TTL = float(env.get('SEMANTIC_CACHE_TTL', '300'))
+
+
+# Single cached instance - read attributes from here instead of os.environ
+CONFIG = _Config(os.environ.copy())
+
+# Module-level aliases kept for backward compatibility (e.g. `config.ANTHROPIC_API_KEY`)
+DEFAULT_LLM_PROVIDER = CONFIG.DEFAULT_LLM_PROVIDER
+DEFAULT_LLM_MODEL = CONFIG.DEFAULT_LLM_MODEL
+ANTHROPIC_API_KEY = CONFIG.ANTHROPIC_API_KEY
+ANTHROPIC_DEFAULT_MODEL = CONFIG.ANTHROPIC_DEFAULT_MODEL
+OPENAI_API_KEY = CONFIG.OPENAI_API_KEY
+OPENAI_DEFAULT_MODEL = CONFIG.OPENAI_DEFAULT_MODEL
+AZURE_OPENAI_API_KEY = CONFIG.AZURE_OPENAI_API_KEY
+AZURE_OPENAI_ENDPOINT = CONFIG.AZURE_OPENAI_ENDPOINT
+AZURE_OPENAI_API_VERSION = CONFIG.AZURE_OPENAI_API_VERSION
+AZURE_OPENAI_DEPLOYMENT_NAME = CONFIG.AZURE_OPENAI_DEPLOYMENT_NAME
+LANGCHAIN_TRACING_V2 = CONFIG.LANGCHAIN_TRACING_V2
+LANGCHAIN_API_KEY = CONFIG.LANGCHAIN_API_KEY
+LANGCHAIN_PROJECT = CONFIG.LANGCHAIN_PROJECT
+LANGCHAIN_ENDPOINT = CONFIG.LANGCHAIN_ENDPOINT
+
+
+def _setup_langsmith():
+    """Export LangSmith settings and preload the langsmith package (runs in a background thread)."""
+    os.environ.setdefault('LANGCHAIN_TRACING_V2', 'true')
+    os.environ.setdefault('LANGCHAIN_PROJECT', CONFIG.LANGCHAIN_PROJECT)
+    os.environ.setdefault('LANGCHAIN_ENDPOINT', CONFIG.LANGCHAIN_ENDPOINT)
+    if CONFIG.LANGCHAIN_API_KEY:
+        os.environ.setdefault('LANGCHAIN_API_KEY', CONFIG.LANGCHAIN_API_KEY)
+
+    # Import only: the tracer builds its own client on the first traced run
+    try:
+        import langsmith  # noqa: F401
+    except Exception as e:
+        _log.warning("⚠️ LangSmith tracing setup failed: %s", e)
+
+
+@lru_cache(maxsize=1)
+def init_tracing_async():
+    """
+    Start LangSmith setup in a daemon thread so the first graph invocation
+    is not blocked on it. Does nothing when tracing is disabled.
+    """
+    if not CONFIG.LANGCHAIN_TRACING_V2:
+        return None
+    thread = threading.Thread(target=_setup_langsmith, name="langsmith-init", daemon=True)
+    thread.start()
+    return thread
+
 
-# ==================== LLM Provider Configuration ====================
+def _has_anthropic() -> bool:
+    return bool(CONFIG.ANTHROPIC_API_KEY)
 
-# Default LLM Provider: "anthropic", "openai", or "azure"
-DEFAULT_LLM_PROVIDER = os.getenv('DEFAULT_LLM_PROVIDER', 'anthropic')
 
-# Default model for each provider (can be overridden via environment variables)
-DEFAULT_LLM_MODEL = os.getenv('DEFAULT_LLM_MODEL', 'claude-sonnet-4-20250514')
+def _has_openai() -> bool:
+    return bool(CONFIG.OPENAI_API_KEY)
 
-# ==================== Anthropic Configuration ====================
-ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
-ANTHROPIC_DEFAULT_MODEL = os.getenv('ANTHROPIC_DEFAULT_MODEL', 'claude-sonnet-4-20250514')
 
-# ==================== OpenAI Configuration ====================
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-OPENAI_DEFAULT_MODEL = os.getenv('OPENAI_DEFAULT_MODEL', 'gpt-4-turbo')
+def _has_azure() -> bool:
+    return bool(
+        CONFIG.AZURE_OPENAI_API_KEY
+        and CONFIG.AZURE_OPENAI_ENDPOINT
+        and CONFIG.AZURE_OPENAI_API_VERSION
+        and CONFIG.AZURE_OPENAI_DEPLOYMENT_NAME
+    )
 
-# ==================== Azure OpenAI Configuration ====================
-AZURE_OPENAI_API_KEY = os.getenv('AZURE_OPENAI_API_KEY')
-AZURE_OPENAI_ENDPOINT = os.getenv('AZURE_OPENAI_ENDPOINT')
-AZURE_OPENAI_API_VERSION = os.getenv('AZURE_OPENAI_API_VERSION', '2024-02-15-preview')
-AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME')
 
-# ==================== LangSmith Configuration ====================
-# Enable LangSmith tracing for monitoring and debugging
-LANGCHAIN_TRACING_V2 = os.getenv('LANGCHAIN_TRACING_V2', 'false').lower() == 'true'
-LANGCHAIN_API_KEY = os.getenv('LANGCHAIN_API_KEY')
-LANGCHAIN_PROJECT = os.getenv('LANGCHAIN_PROJECT', 'contract-draft-poc')
-LANGCHAIN_ENDPOINT = os.getenv('LANGCHAIN_ENDPOINT', 'https://api.smith.langchain.com')
+# Provider name -> (credential check, error detail when missing)
+_PROVIDER_CHECKS = {
+    'anthropic': (_has_anthropic, "ANTHROPIC_API_KEY is not configured."),
+    'openai': (_has_openai, "OPENAI_API_KEY is not configured."),
+    'azure': (_has_azure, "Azure OpenAI credentials are not fully configured."),
+}
 
 
 def validate_config():
@@ -39,52 +160,38 @@ def validate_config():
     Validates that at least one LLM provider is configured.
     Raises ValueError if no provider credentials are found.
     """
-    has_anthropic = bool(ANTHROPIC_API_KEY)
-    has_openai = bool(OPENAI_API_KEY)
-    has_azure = all([
-        AZURE_OPENAI_API_KEY,
-        AZURE_OPENAI_ENDPOINT,
-        AZURE_OPENAI_API_VERSION,
-        AZURE_OPENAI_DEPLOYMENT_NAME
-    ])
-
-    if not (has_anthropic or has_openai or has_azure):
-        raise ValueError(
-            "No LLM provider configured. Please set credentials for at least one provider:\n"
-            "- Anthropic: ANTHROPIC_API_KEY\n"
-            "- OpenAI: OPENAI_API_KEY\n"
-            "- Azure: AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, "
-            "AZURE_OPENAI_API_VERSION, AZURE_OPENAI_DEPLOYMENT_NAME"
-        )
-
-    # Validate that the default provider is actually configured
-    if DEFAULT_LLM_PROVIDER == 'anthropic' and not has_anthropic:
-        raise ValueError(
-            f"DEFAULT_LLM_PROVIDER is set to '{DEFAULT_LLM_PROVIDER}' but "
-            "ANTHROPIC_API_KEY is not configured."
-        )
-    elif DEFAULT_LLM_PROVIDER == 'openai' and not has_openai:
-        raise ValueError(
-            f"DEFAULT_LLM_PROVIDER is set to '{DEFAULT_LLM_PROVIDER}' but "
-            "OPENAI_API_KEY is not configured."
-        )
-    elif DEFAULT_LLM_PROVIDER == 'azure' and not has_azure:
-        raise ValueError(
-            f"DEFAULT_LLM_PROVIDER is set to '{DEFAULT_LLM_PROVIDER}' but "
-            "Azure OpenAI credentials are not fully configured."
-        )
-
-    # Print available providers for debugging
-    available_providers = []
-    if has_anthropic:
-        available_providers.append("anthropic")
-    if has_openai:
-        available_providers.append("openai")
-    if has_azure:
-        available_providers.append("azure")
-
-    print(f"✓ Configured LLM providers: {', '.join(available_providers)}")
-    print(f"✓ Default provider: {DEFAULT_LLM_PROVIDER}")
-
-
-validate_config()
\ No newline at end of file
+    default_provider = CONFIG.DEFAULT_LLM_PROVIDER
+    default_check = _PROVIDER_CHECKS.get(default_provider)
+
+    # Happy path: only the default provider's credentials are checked
+    if default_check is None or not default_check[0]():
+        if not any(check() for check, _ in _PROVIDER_CHECKS.values()):
+            raise ValueError(
+                "No LLM provider configured. Please set credentials for at least one provider:\n"
+                "- Anthropic: ANTHROPIC_API_KEY\n"
+                "- OpenAI: OPENAI_API_KEY\n"
+                "- Azure: AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, "
+                "AZURE_OPENAI_API_VERSION, AZURE_OPENAI_DEPLOYMENT_NAME"
+            )
+
+        # Validate that the default provider is actually configured
+        if default_check is not None:
+            raise ValueError(
+                f"DEFAULT_LLM_PROVIDER is set to '{default_provider}' but {default_check[1]}"
+            )
+
+    # Log available providers for debugging (skipped entirely below INFO)
+    if _log.isEnabledFor(logging.INFO):
+        available_providers = [name for name, (check, _) in _PROVIDER_CHECKS.items() if check()]
+        _log.info("✓ Configured LLM providers: %s", ", ".join(available_providers))
+        _log.info("✓ Default provider: %s", default_provider)
+
+
+@lru_cache(maxsize=1)
+def ensure_validated() -> None:
+    """
+    Run validate_config() once, on first use.
+
+    Called lazily by the LLM client factory so importing config stays cheap.
+    """
+    validate_config()
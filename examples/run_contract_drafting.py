@@ -1,13 +1,23 @@
 """Example script to run the contract drafting workflow."""
 
+import logging
 import sys
-import os
+from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add project root to path (once)
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from src.contract_drafting_graph import create_contract_drafting_graph
-from datetime import datetime
+from src.models.contract_drafting_state import create_initial_state
+
+_log = logging.getLogger(__name__)
+
+# Message type -> content formatter; anything not listed falls back to str()
+_MESSAGE_FORMATTERS = {
+    dict: lambda msg: msg.get('content', str(msg)),
+}
 
 
 def main():
@@ -25,12 +35,12 @@ def main():
     # Example 1: Site Supervision Subcontract with documents
     print("\n🔹 Example 1: Site Supervision Subcontract\n")
 
-    initial_state = {
+    initial_state = create_initial_state(
         # Contract type selection
-        "contract_type_id": "00827bca-eccf-4e5a-87bb-dcd438c4ff29",  # Site Supervision
+        contract_type_id="00827bca-eccf-4e5a-87bb-dcd438c4ff29",  # Site Supervision
 
         # Project description
-        "project_description": """
+        project_description="""
         Bauüberwachung für ein Bürogebäudeprojekt in Berlin.
         Das Projekt umfasst den Neubau eines 5-stöckigen Bürogebäudes mit ca. 3.000 qm Nutzfläche.
         Die Bauüberwachung soll die Qualitätskontrolle, Sicherheitsmanagement und
@@ -38,7 +48,7 @@ def main():
         """,
 
         # Documents (if available)
-        "uploaded_documents": [
+        uploaded_documents=[
             # {
             #     "type": "verhandlungsprotokoll",
             #     "path": "data/uploads/verhandlungsprotokoll.pdf"
@@ -48,26 +58,7 @@ def main():
             #     "path": "data/uploads/leistungsverzeichnis.xlsx"
             # }
         ],
-
-        # Initialize required fields
-        "messages": [],
-        "errors": [],
-        "retrieved_contracts": [],
-        "retrieved_clauses": [],
-        "contract_structures": [],
-        "consistency_issues": [],
-        "output_files": {},
-        "generated_sections": {},
-        "section_mappings": {},
-        "contract_outline": [],
-        "quality_report": {},
-        "quality_score": 0.0,
-        "quality_passed": False,
-        "current_step": "",
-        "processing_status": "initialized",
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
-    }
+    )
 
     try:
         # Run the workflow
@@ -89,21 +80,21 @@ def main():
         print(f"⚠️  Consistency Issues: {len(result.get('consistency_issues', []))}")
         print()
 
-        # Print output files
-        print("📁 Output Files:")
-        for file_type, path in result.get('output_files', {}).items():
-            print(f"   {file_type.upper()}: {path}")
-        print()
-
-        # Print messages
-        print("📝 Workflow Messages:")
-        for msg in result.get('messages', [])[-10:]:  # Last 10 messages
-            if isinstance(msg, dict):
-                content = msg.get('content', str(msg))
-            else:
-                content = str(msg)
-            print(f"   {content}")
-        print()
+        # Print output files and messages in a single write
+        lines = ["📁 Output Files:"]
+        lines += [
+            f"   {file_type.upper()}: {path}"
+            for file_type, path in result.get('output_files', {}).items()
+        ]
+        lines.append("")
+
+        lines.append("📝 Workflow Messages:")
+        lines += [
+            f"   {_MESSAGE_FORMATTERS.get(type(msg), str)(msg)}"
+            for msg in result.get('messages', [])[-10:]  # Last 10 messages
+        ]
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Print contract preview
         contract_draft = result.get('contract_draft', '')
@@ -118,9 +109,7 @@ def main():
         print("✅ Workflow completed successfully!")
 
     except Exception as e:
-        print(f"\n❌ Error running workflow: {e}")
-        import traceback
-        traceback.print_exc()
+        _log.exception("\n❌ Error running workflow: %s", e)
 
 
 if __name__ == "__main__":
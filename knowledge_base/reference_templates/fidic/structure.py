@@ -1,3 +1,10 @@
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+# Read-only reference data. Sequences are tuple literals so the compiler stores
+# them as constants in the .pyc instead of rebuilding lists on every import.
+
 FIDIC_RED_BOOK_STRUCTURE = {
     "PART_1_GENERAL": {
         "clauses": {
@@ -19,12 +26,12 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "1.13": "Compliance with Laws",
                     "1.14": "Joint and Several Liability"
                 },
-                "critical_for": ["legal_framework", "document_hierarchy"],
-                "turkish_considerations": [
+                "critical_for": ("legal_framework", "document_hierarchy"),
+                "turkish_considerations": (
                     "Governing law often Turkish Law",
                     "Language: Turkish + English bilingual",
                     "Priority of documents must be clear"
-                ]
+                )
             },
 
             "2": {
@@ -36,7 +43,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "2.4": "Employer's Financial Arrangements",
                     "2.5": "Employer's Claims"
                 },
-                "critical_for": ["site_access", "permits", "employer_obligations"]
+                "critical_for": ("site_access", "permits", "employer_obligations")
             },
 
             "3": {
@@ -49,7 +56,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "3.5": "Determinations",
                     "3.7": "Agreement or Determination"
                 },
-                "critical_for": ["contract_administration", "determinations"],
+                "critical_for": ("contract_administration", "determinations"),
                 "key_difference_from_vob": "Engineer has significant authority (not in VOB)",
                 "turkish_context": "Engineer role often controversial - local practice varies"
             },
@@ -82,11 +89,11 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "4.23": "Contractor's Operations on Site",
                     "4.24": "Fossils"
                 },
-                "critical_for": ["contractor_obligations", "unforeseen_conditions"],
-                "most_disputed_clauses": [
+                "critical_for": ("contractor_obligations", "unforeseen_conditions"),
+                "most_disputed_clauses": (
                     "4.11 - Sufficiency of Contract Amount",
                     "4.12 - Unforeseeable Physical Conditions"
-                ],
+                ),
                 "turkish_specific": "4.12 heavily negotiated - ground conditions disputes common"
             }
         }
@@ -102,7 +109,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "5.3": "Payments to Nominated Subcontractors",
                     "5.4": "Evidence of Payments"
                 },
-                "critical_for": ["subcontractor_management"]
+                "critical_for": ("subcontractor_management",)
             },
 
             "6": {
@@ -131,12 +138,12 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "6.21": "Prohibition of Harmful Child Labour",
                     "6.22": "Employment Records of Workers"
                 },
-                "critical_for": ["labor_compliance", "HSE"],
-                "turkish_critical": [
+                "critical_for": ("labor_compliance", "HSE"),
+                "turkish_critical": (
                     "6.4 - İş Kanunu compliance",
                     "6.12 - Work permits for foreign personnel",
                     "6.7 - İş Sağlığı ve Güvenliği requirements"
-                ]
+                )
             },
 
             "7": {
@@ -151,7 +158,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "7.7": "Ownership of Plant and Materials",
                     "7.8": "Royalties"
                 },
-                "critical_for": ["quality_control", "testing"]
+                "critical_for": ("quality_control", "testing")
             },
 
             "8": {
@@ -170,20 +177,20 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "8.11": "Prolonged Suspension",
                     "8.12": "Resumption of Work"
                 },
-                "critical_for": ["schedule_management", "delay_claims", "EOT"],
-                "most_critical_clauses": [
+                "critical_for": ("schedule_management", "delay_claims", "EOT"),
+                "most_critical_clauses": (
                     "8.4 - Extension of Time (EOT procedure)",
                     "8.7 - Delay Damages (liquidated damages)"
-                ],
+                ),
                 "procedural_requirements": {
                     "8.4_EOT_claim": "Notice within 28 days of cause",
                     "8.7_LD_cap": "Usually 10% of Contract Price"
                 },
-                "turkish_considerations": [
+                "turkish_considerations": (
                     "Force majeure provisions heavily negotiated",
                     "Weather delays - reference to historical data",
                     "Government delay provisions critical for PPP projects"
-                ]
+                )
             },
 
             "9": {
@@ -194,7 +201,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "9.3": "Retesting",
                     "9.4": "Failure to Pass Tests on Completion"
                 },
-                "critical_for": ["completion", "performance_testing"]
+                "critical_for": ("completion", "performance_testing")
             },
 
             "10": {
@@ -205,12 +212,12 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "10.3": "Interference with Tests on Completion",
                     "10.4": "Surfaces Requiring Reinstatement"
                 },
-                "critical_for": ["handover", "warranty_start"],
-                "legal_significance": [
+                "critical_for": ("handover", "warranty_start"),
+                "legal_significance": (
                     "Triggers warranty period (Clause 11)",
                     "Transfers risk to Employer",
                     "Triggers performance securities release (partial)"
-                ],
+                ),
                 "document_output": "Taking Over Certificate"
             },
 
@@ -229,7 +236,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "11.10": "Unfulfilled Obligations",
                     "11.11": "Clearance of Site"
                 },
-                "critical_for": ["warranty", "defects_management"],
+                "critical_for": ("warranty", "defects_management"),
                 "defects_notification_period": "Usually 12 months (can be longer)",
                 "comparison_to_vob": "Shorter than VOB/B (12 months vs. 2-4 years)",
                 "turkish_practice": "Often extended to 24 months in practice"
@@ -247,7 +254,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "12.3": "Retesting",
                     "12.4": "Failure to Pass Tests after Completion"
                 },
-                "critical_for": ["performance_guarantees"]
+                "critical_for": ("performance_guarantees",)
             },
 
             "13": {
@@ -262,17 +269,17 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "13.7": "Adjustments for Changes in Legislation",
                     "13.8": "Adjustments for Changes in Cost"
                 },
-                "critical_for": ["change_orders", "variations", "cost_adjustments"],
-                "most_negotiated": [
+                "critical_for": ("change_orders", "variations", "cost_adjustments"),
+                "most_negotiated": (
                     "13.3 - Variation valuation method",
                     "13.8 - Price escalation formula"
-                ],
+                ),
                 "turkish_specific": "13.7 critical due to frequent legislative changes",
-                "valuation_hierarchy": [
+                "valuation_hierarchy": (
                     "1. Bill of Quantities rates",
                     "2. Agreed rates",
                     "3. Engineer's determination"
-                ]
+                )
             },
 
             "14": {
@@ -294,7 +301,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "14.14": "Cessation of Employer's Liability",
                     "14.15": "Currencies of Payment"
                 },
-                "critical_for": ["payment_cycle", "cash_flow", "final_account"],
+                "critical_for": ("payment_cycle", "cash_flow", "final_account"),
                 "payment_timeline": {
                     "interim_payment_period": "Monthly",
                     "engineer_certification": "28 days from application",
@@ -315,15 +322,15 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "15.4": "Payment after Termination",
                     "15.5": "Employer's Entitlement to Termination for Convenience"
                 },
-                "critical_for": ["termination_rights", "exit_costs"],
-                "grounds_for_termination": [
+                "critical_for": ("termination_rights", "exit_costs"),
+                "grounds_for_termination": (
                     "Contractor abandonment",
                     "Contractor insolvency",
                     "Failure to commence works",
                     "Suspension > 84 days",
                     "Assignment without consent",
                     "Bribery/corruption"
-                ],
+                ),
                 "termination_for_convenience": "Employer can terminate without cause (15.5)",
                 "financial_consequences": "Payment for work done + reasonable profit on unexecuted work (15.5)"
             },
@@ -336,14 +343,14 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "16.3": "Cessation of Work and Removal of Contractor's Equipment",
                     "16.4": "Payment on Termination"
                 },
-                "critical_for": ["contractor_protection", "payment_security"],
-                "grounds_for_termination": [
+                "critical_for": ("contractor_protection", "payment_security"),
+                "grounds_for_termination": (
                     "Non-payment > 56 days after due date",
                     "Prolonged suspension > 84 days",
                     "Force majeure > 140 days",
                     "Engineer fails to issue certificates",
                     "Employer's insolvency"
-                ],
+                ),
                 "financial_consequences": "Full payment for work done + cost of repatriation + reasonable profit"
             },
 
@@ -358,8 +365,8 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "17.6": "Limitation of Liability",
                     "17.7": "Use of Employer's Accommodation/Facilities"
                 },
-                "critical_for": ["risk_allocation", "liability", "insurance"],
-                "employer_risks": [
+                "critical_for": ("risk_allocation", "liability", "insurance"),
+                "employer_risks": (
                     "War, hostilities, invasion",
                     "Riots, disorder in country",
                     "Munitions of war, radiation",
@@ -367,7 +374,7 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "Design prepared by Employer's Personnel",
                     "Use/occupation by Employer",
                     "Any operation of forces of nature which is Unforeseeable"
-                ],
+                ),
                 "contractor_risks": "All risks not specifically allocated to Employer",
                 "liability_caps": "Often capped at Contract Price (negotiable)"
             },
@@ -380,14 +387,14 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "18.3": "Insurance against Injury to Persons and Damage to Property",
                     "18.4": "Insurance for Contractor's Personnel"
                 },
-                "critical_for": ["risk_mitigation", "insurance_compliance"],
-                "required_insurances": [
+                "critical_for": ("risk_mitigation", "insurance_compliance"),
+                "required_insurances": (
                     "Works Insurance (all risks)",
                     "Contractor's Equipment Insurance",
                     "Third Party Liability",
                     "Employer's Personnel (if applicable)",
                     "Professional Indemnity (for design elements)"
-                ],
+                ),
                 "turkish_requirements": "Zorunlu Trafik Sigortası, İş Kazası Sigortası (compulsory)",
                 "claims_procedure": "Clause 17 & 18 interaction critical"
             },
@@ -403,19 +410,19 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "19.6": "Optional Termination, Payment and Release",
                     "19.7": "Release from Performance under the Law"
                 },
-                "critical_for": ["extraordinary_events", "termination"],
-                "force_majeure_events": [
+                "critical_for": ("extraordinary_events", "termination"),
+                "force_majeure_events": (
                     "War (unless in country already)",
                     "Rebellion, revolution",
                     "Strikes/lockouts (not by Contractor's personnel)",
                     "Natural catastrophes",
                     "Epidemic"
-                ],
-                "consequences": [
+                ),
+                "consequences": (
                     "Extension of Time (no cost)",
                     "Termination if > 140 days continuous",
                     "Each party bears own costs"
-                ],
+                ),
                 "turkish_context": "Earthquakes explicitly included (frequent in Turkey)",
                 "2020_addendum": "COVID-19 provisions often added"
             },
@@ -432,25 +439,94 @@ FIDIC_RED_BOOK_STRUCTURE = {
                     "20.7": "Failure to Comply with Dispute Avoidance/Adjudication Board's Decision",
                     "20.8": "Expiry of Dispute Avoidance/Adjudication Board's Appointment"
                 },
-                "critical_for": ["dispute_resolution", "claims_management"],
+                "critical_for": ("dispute_resolution", "claims_management"),
                 "claims_procedure": {
                     "notice_deadline": "28 days of becoming aware",
                     "fully_detailed_claim": "42 days from notice",
                     "supporting_documentation": "Contemporary records critical"
                 },
-                "dispute_resolution_tiers": [
+                "dispute_resolution_tiers": (
                     "1. Engineer's determination (mandatory first step)",
                     "2. DAAB (Dispute Avoidance/Adjudication Board)",
                     "3. Amicable settlement (56 days)",
                     "4. Arbitration (ICC usually)"
-                ],
-                "turkish_arbitration": [
+                ),
+                "turkish_arbitration": (
                     "Istanbul Arbitration Centre (ISTAC)",
                     "ICC Paris",
                     "Often bilingual proceedings (Turkish/English)"
-                ],
+                ),
                 "procedural_strictness": "VERY STRICT - missed deadlines = waiver of claims"
             }
         }
     }
-}
\ No newline at end of file
+}
+
+# Keys whose values are unordered tag sets (membership tests, set algebra)
+_TAG_KEYS = frozenset({"critical_for"})
+
+
+def _freeze(obj):
+    """
+    Recursively make the structure read-only: dicts become MappingProxyType,
+    lists become tuples (frozensets for tag keys), and dict keys and short
+    strings (tags, clause numbers) are interned.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({
+            sys.intern(k): frozenset(_freeze(v)) if k in _TAG_KEYS else _freeze(v)
+            for k, v in obj.items()
+        })
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, str) and len(obj) < 32:
+        return sys.intern(obj)
+    return obj
+
+
+FIDIC_RED_BOOK_STRUCTURE = _freeze(FIDIC_RED_BOOK_STRUCTURE)
+
+
+# ==================== Columnar views ====================
+# Parallel tuples over all clauses (index i refers to the same clause in each),
+# plus an inverted index so tag lookups don't have to walk the nested dict.
+
+_CLAUSES = tuple(
+    (clause_id, clause)
+    for part in FIDIC_RED_BOOK_STRUCTURE.values()
+    for clause_id, clause in part["clauses"].items()
+)
+
+CLAUSE_IDS = tuple(clause_id for clause_id, _ in _CLAUSES)
+CLAUSE_TITLES = tuple(clause["title"] for _, clause in _CLAUSES)
+CRITICAL_FOR = tuple(clause.get("critical_for", frozenset()) for _, clause in _CLAUSES)
+
+CRITICAL_FOR_INDEX = {
+    tag: tuple(i for i, tags in enumerate(CRITICAL_FOR) if tag in tags)
+    for tag in sorted(set().union(*CRITICAL_FOR))
+}
+
+# Subclause number -> (clause number, subclause title), e.g. "8.4" -> ("8", "Extension of Time for Completion")
+SUBCLAUSE_BY_NUMBER = {
+    subclause_id: (clause_id, title)
+    for clause_id, clause in _CLAUSES
+    for subclause_id, title in clause["subclauses"].items()
+}
+
+# critical_for tag -> clause numbers carrying that tag
+CLAUSES_BY_TAG = {
+    tag: tuple(CLAUSE_IDS[i] for i in positions)
+    for tag, positions in CRITICAL_FOR_INDEX.items()
+}
+
+del _CLAUSES
+
+
+@lru_cache(maxsize=128)
+def clauses_by_tags(tags: frozenset) -> tuple:
+    """Return clause numbers whose critical_for tags include ALL of `tags`."""
+    return tuple(
+        clause_id
+        for clause_id, clause_tags in zip(CLAUSE_IDS, CRITICAL_FOR)
+        if tags <= clause_tags
+    )
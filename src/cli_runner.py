@@ -0,0 +1,224 @@
+"""
+Shared command-line runner for contract workflows.
+
+Holds the console output helpers (banner, step log, final report), resource
+document discovery and the invoke/report loop, so entry points only need to
+parse arguments and assemble the initial state.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from typing import Any, Callable, Dict, List
+
+# Step logger: timestamped lines on stdout, configured once at import
+logger = logging.getLogger("contract_generation")
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+logger.addHandler(_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+def _event_loop_factory():
+    """uvloop's event loop if installed, otherwise asyncio's default."""
+    # Import here to avoid errors if uvloop is not installed (it is optional)
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def print_banner(title: str, subtitle: str = ""):
+    """Print welcome banner."""
+    lines = ["", "=" * 80, f"  {title}"]
+    if subtitle:
+        lines.append(f"  {subtitle}")
+    lines += ["=" * 80, "", ""]
+    sys.stdout.write("\n".join(lines))
+
+
+def print_step(step: str, message: str):
+    """Print a step in the process."""
+    logger.info("%s: %s", step, message)
+
+
+# Resource discovery: document keyword (matched case-insensitively) and
+# accepted suffixes, in order of preference.
+_VP_KEY = "verhandlungsprotokoll"
+_VP_EXTS = (".pdf", ".docx")
+_LV_KEY = "leistungsverzeichnis"
+_LV_EXTS = (".xlsx", ".xls")
+
+
+def _candidate_rank(name_l: str, key: str, exts: tuple):
+    """
+    Rank a lower-cased file name for one document category (lower is better).
+
+    Files containing the keyword come first, then any file with an accepted
+    suffix; within each tier the suffix order of `exts` applies.
+    Returns None if the suffix is not accepted.
+    """
+    for ext_rank, ext in enumerate(exts):
+        if name_l.endswith(ext):
+            return (0 if key in name_l else len(exts)) + ext_rank
+    return None
+
+
+def find_resource_documents(resource_dir: str = "resource"):
+    """
+    Find a Verhandlungsprotokoll and a Leistungsverzeichnis in a single directory scan.
+
+    Returns:
+        Tuple of (vp_path, lv_path); either may be None.
+    """
+    # Best candidate per category as (rank, path); lower rank wins
+    best_vp = best_lv = None
+
+    try:
+        with os.scandir(resource_dir) as entries:
+            for entry in entries:
+                name_l = entry.name.lower()
+                if name_l.startswith(".") or not entry.is_file():
+                    continue
+
+                rank = _candidate_rank(name_l, _VP_KEY, _VP_EXTS)
+                if rank is not None:
+                    if best_vp is None or rank < best_vp[0]:
+                        best_vp = (rank, entry.path)
+                else:
+                    rank = _candidate_rank(name_l, _LV_KEY, _LV_EXTS)
+                    if rank is not None and (best_lv is None or rank < best_lv[0]):
+                        best_lv = (rank, entry.path)
+
+                # Both categories have a best-possible match - stop scanning
+                if best_vp and best_lv and best_vp[0] == 0 and best_lv[0] == 0:
+                    break
+    except FileNotFoundError:
+        pass
+
+    return (best_vp[1] if best_vp else None, best_lv[1] if best_lv else None)
+
+
+def format_results(final_state: dict) -> str:
+    """Render the post-workflow report as one string."""
+    parts = ["", "=" * 80, "  WORKFLOW COMPLETED", "=" * 80]
+
+    # Display messages from the workflow
+    if final_state.get("messages"):
+        parts.append("\n📊 Process Log:")
+        parts.extend(
+            f"  {msg['content']}" if isinstance(msg, dict) and msg.get("content") else f"  {msg}"
+            for msg in final_state["messages"]
+        )
+
+    # Display consistency issues
+    consistency_issues = final_state.get("consistency_issues", [])
+    if consistency_issues:
+        parts.append(f"\n⚠️ Consistency Issues: {len(consistency_issues)}")
+        parts.extend(
+            f"  [{issue.get('severity', 'unknown').upper()}] {issue.get('message', str(issue))}"
+            for issue in consistency_issues[:5]
+        )
+
+    # Display quality report
+    quality_report = final_state.get("quality_report", {})
+    if quality_report:
+        parts += [
+            "\n📈 Quality Report:",
+            f"  Score: {quality_report.get('score', 0):.1f}/100",
+            f"  Level: {quality_report.get('level', 'N/A')}",
+            f"  Sections: {quality_report.get('sections_generated', 0)}/{quality_report.get('sections_required', 0)}",
+            f"  Contract Length: {quality_report.get('contract_length', 0)} chars",
+        ]
+
+    # Display output information
+    output_files = final_state.get("output_files", {})
+    if output_files:
+        parts += ["\n✅ Contract generated successfully!", "📁 Output files:"]
+        parts.extend(f"  - {file_type.upper()}: {path}" for file_type, path in output_files.items())
+    else:
+        parts.append("\n❌ Contract generation did not complete successfully.")
+
+    # Show a preview if available
+    contract_draft = final_state.get("contract_draft")
+    if contract_draft:
+        parts += ["\n📄 Contract Preview (first 500 characters):", "-" * 40, contract_draft[:500]]
+        if len(contract_draft) > 500:
+            parts.append("\n[... document continues ...]")
+
+    return "\n".join(parts) + "\n"
+
+
+async def _execute(graph, initial_state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the graph to completion and return the final state.
+
+    At DEBUG level (--verbose) the run is streamed instead, logging each
+    node's state update as it finishes.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return await graph.ainvoke(initial_state, config)
+
+    final_state = None
+    async for mode, chunk in graph.astream(initial_state, config, stream_mode=["updates", "values"]):
+        if mode == "values":
+            final_state = chunk
+            continue
+        for node, update in chunk.items():
+            keys = ", ".join(update) if isinstance(update, dict) else "-"
+            logger.debug("NODE: %s finished (updated: %s)", node, keys)
+    return final_state
+
+
+def run(
+    graph_factory: Callable[[], Any],
+    initial_state: Dict[str, Any],
+    run_name: str,
+    tags: List[str],
+    thread_id: str = "contract_gen_001",
+):
+    """
+    Build the graph, execute it and print the final report.
+
+    Args:
+        graph_factory: Zero-argument callable returning a compiled graph
+        initial_state: State passed to graph.invoke()
+        run_name: Run name shown in LangSmith
+        tags: LangSmith tags for the run
+        thread_id: Checkpointer thread id
+    """
+    # Initialize the graph
+    print_step("INIT", "Building workflow graph...")
+    graph = graph_factory()
+
+    # Run the workflow
+    print_step("START", "Executing workflow...")
+    print("-" * 80)
+
+    try:
+        # Execute the graph with metadata for LangSmith
+        config = {
+            "configurable": {"thread_id": thread_id},
+            # Caps parallel tasks per step (e.g. clause sections) to stay within provider rate limits
+            "max_concurrency": 8,
+            "run_name": run_name,
+            "tags": tags
+        }
+
+        # ainvoke lets the async fan-out nodes run concurrently
+        with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+            final_state = runner.run(_execute(graph, initial_state, config))
+
+        # Print results in a single write
+        sys.stdout.write(format_results(final_state))
+
+    except Exception as e:
+        # Traceback goes through the step logger, so it can be filtered/redirected
+        logger.exception("❌ Error during workflow execution: %s", e)
+
+    print("\n" + "=" * 80)
+    print("  Process complete. Check 'data/output' folder for generated contracts.")
+    print("=" * 80 + "\n")
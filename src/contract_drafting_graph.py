@@ -1,28 +1,41 @@
 """Main LangGraph workflow for general contract drafting."""
 
+import logging
+from functools import lru_cache
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
-
-from src.models.contract_drafting_state import ContractDraftingState
-from src.nodes.contract_drafting import (
-    user_input_handler_node,
-    knowledge_base_fetcher_node,
-    structure_analyzer_node,
-    content_mapper_node,
-    clause_generator_node,
-    consistency_checker_node,
-    quality_reviewer_node,
-    output_formatter_node,
-)
 
-# Reuse existing extractors
-from src.nodes import (
-    document_extractor_node,
-    excel_extractor_node,
+from config import init_tracing_async
+
+__all__ = ["create_contract_drafting_graph"]
+
+_log = logging.getLogger(__name__)
+
+# Static edges of the workflow; content_mapper -> clause_section fans out via
+# a conditional edge added in the factory
+_EDGES = (
+    (START, "user_input_handler"),
+    # Parallel execution: document_extractor, excel_extractor, knowledge_base_fetcher
+    ("user_input_handler", "document_extractor"),
+    ("user_input_handler", "excel_extractor"),
+    ("user_input_handler", "knowledge_base_fetcher"),
+    # All three parallel nodes feed into structure_analyzer
+    ("document_extractor", "structure_analyzer"),
+    ("excel_extractor", "structure_analyzer"),
+    ("knowledge_base_fetcher", "structure_analyzer"),
+    # Continue with sequential flow
+    ("structure_analyzer", "content_mapper"),
+    ("clause_section", "clause_aggregator"),
+    ("clause_aggregator", "consistency_checker"),
+    ("consistency_checker", "quality_reviewer"),
+    ("quality_reviewer", "output_formatter"),
+    ("output_formatter", END),
 )
 
 
-def create_contract_drafting_graph():
+@lru_cache(maxsize=4)
+def create_contract_drafting_graph(*, checkpointer=None, cache: bool = False):
     """
     Create the general contract drafting workflow graph.
 
@@ -34,63 +47,110 @@ def create_contract_drafting_graph():
        - Knowledge Base Fetcher - Get historical contracts/clauses (can fail gracefully)
     3. Structure Analyzer - Build contract outline (waits for all 3 parallel nodes)
     4. Content Mapper - Map extracted data to sections
-    5. Clause Generator - Generate contract sections
+    5. Clause Generator - Generate contract sections (one parallel task per
+       section, joined by the clause aggregator)
     6. Consistency Checker - Validate consistency
     7. Quality Reviewer - Assess quality
     8. Output Formatter - Generate final files
 
+    Args:
+        checkpointer: Optional checkpointer (e.g. MemorySaver) for resumable
+            runs. None by default: every super-step checkpoint costs a state
+            snapshot, and a single CLI run never resumes.
+        cache: Cache structure_analyzer/content_mapper results for a day,
+            keyed on their input state. content_mapper is rule-based, but
+            structure_analyzer samples its outline from the LLM: with caching
+            the first sampled outline is replayed for the same input instead
+            of drawing a new one. Don't combine with MemorySaver - the
+            checkpointer bypasses the node cache.
+
     Returns:
-        Compiled LangGraph workflow
+        Compiled LangGraph workflow. Memoized per argument combination; use
+        create_contract_drafting_graph.__wrapped__(...) for a fresh build.
     """
-    print("🔧 Building contract drafting workflow...")
+    _log.debug("Building contract drafting workflow")
+
+    # Set up LangSmith tracing in the background (no-op if disabled)
+    init_tracing_async()
+
+    # Node modules pull in pdfplumber/pandas/LLM SDKs; load them only when a
+    # graph is actually built
+    from src.models.contract_drafting_state import ContractDraftingState
+    from src.nodes.contract_drafting import (
+        user_input_handler_node,
+        knowledge_base_fetcher_node,
+        aknowledge_base_fetcher_node,
+        structure_analyzer_node,
+        content_mapper_node,
+        route_clause_sections,
+        clause_section_node,
+        aclause_section_node,
+        clause_aggregator_node,
+        consistency_checker_node,
+        quality_reviewer_node,
+        output_formatter_node,
+        aoutput_formatter_node,
+    )
+    # Reuse existing extractors
+    from src.nodes import (
+        document_extractor_node,
+        adocument_extractor_node,
+        excel_extractor_node,
+        aexcel_extractor_node,
+    )
 
     # Initialize the graph
     graph = StateGraph(ContractDraftingState)
 
-    # Add all nodes
-    graph.add_node("user_input_handler", user_input_handler_node)
-    graph.add_node("document_extractor", document_extractor_node)
-    graph.add_node("excel_extractor", excel_extractor_node)
-    graph.add_node("knowledge_base_fetcher", knowledge_base_fetcher_node)
-    graph.add_node("structure_analyzer", structure_analyzer_node)
-    graph.add_node("content_mapper", content_mapper_node)
-    graph.add_node("clause_generator", clause_generator_node)
-    graph.add_node("consistency_checker", consistency_checker_node)
-    graph.add_node("quality_reviewer", quality_reviewer_node)
-    graph.add_node("output_formatter", output_formatter_node)
+    # Opt-in: content_mapper is deterministic, but a cached structure_analyzer
+    # reuses one sampled outline per input state rather than recomputing it.
+    # Node caching needs langgraph >= 0.4, so only pass it when asked for.
+    cache_kwargs = {}
+    if cache:
+        from langgraph.types import CachePolicy
+        cache_kwargs["cache_policy"] = CachePolicy(ttl=24 * 3600)
+
+    # (name, action, add_node kwargs). Fan-out nodes are I/O bound: each has a
+    # sync body for invoke() and an async variant (blocking work offloaded to
+    # a thread) for ainvoke()
+    nodes = [
+        ("user_input_handler", user_input_handler_node, {}),
+        ("document_extractor", RunnableLambda(document_extractor_node, afunc=adocument_extractor_node), {}),
+        ("excel_extractor", RunnableLambda(excel_extractor_node, afunc=aexcel_extractor_node), {}),
+        ("knowledge_base_fetcher", RunnableLambda(knowledge_base_fetcher_node, afunc=aknowledge_base_fetcher_node), {}),
+        ("structure_analyzer", structure_analyzer_node, cache_kwargs),
+        ("content_mapper", content_mapper_node, cache_kwargs),
+        ("clause_section", RunnableLambda(clause_section_node, afunc=aclause_section_node), {}),
+        ("clause_aggregator", clause_aggregator_node, {}),
+        ("consistency_checker", consistency_checker_node, {}),
+        ("quality_reviewer", quality_reviewer_node, {}),
+        ("output_formatter", RunnableLambda(output_formatter_node, afunc=aoutput_formatter_node), {}),
+    ]
+    for name, action, node_kwargs in nodes:
+        graph.add_node(name, action, **node_kwargs)
 
     # Define the flow
-    graph.add_edge(START, "user_input_handler")
-
-    # Parallel execution: document_extractor, excel_extractor, knowledge_base_fetcher
-    graph.add_edge("user_input_handler", "document_extractor")
-    graph.add_edge("user_input_handler", "excel_extractor")
-    graph.add_edge("user_input_handler", "knowledge_base_fetcher")
+    for source, target in _EDGES:
+        graph.add_edge(source, target)
 
-    # All three parallel nodes feed into structure_analyzer
-    graph.add_edge("document_extractor", "structure_analyzer")
-    graph.add_edge("excel_extractor", "structure_analyzer")
-    graph.add_edge("knowledge_base_fetcher", "structure_analyzer")
-
-    # Continue with sequential flow
-    graph.add_edge("structure_analyzer", "content_mapper")
-    graph.add_edge("content_mapper", "clause_generator")
-    graph.add_edge("clause_generator", "consistency_checker")
-    graph.add_edge("consistency_checker", "quality_reviewer")
-    graph.add_edge("quality_reviewer", "output_formatter")
-    graph.add_edge("output_formatter", END)
+    # Fork-join: one clause_section task per outline section, then aggregate
+    graph.add_conditional_edges("content_mapper", route_clause_sections, ["clause_section", "clause_aggregator"])
 
-    # Compile the graph with memory for checkpointing
-    memory = MemorySaver()
-    compiled_graph = graph.compile(checkpointer=memory)
+    # Compile; checkpointing and node caching are opt-in
+    compile_kwargs = {}
+    if cache:
+        from langgraph.cache.memory import InMemoryCache
+        compile_kwargs["cache"] = InMemoryCache()
+    compiled_graph = graph.compile(checkpointer=checkpointer, **compile_kwargs)
 
-    print("✓ Contract drafting workflow built successfully")
+    _log.debug("Contract drafting workflow built")
 
     return compiled_graph
 
 
 if __name__ == "__main__":
-    # Test graph creation
+    # Test graph creation (show the factory's debug messages)
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     graph = create_contract_drafting_graph()
     print("\n✓ Graph created successfully!")
     print("  Nodes:", list(graph.nodes.keys()) if hasattr(graph, 'nodes') else "N/A")
@@ -5,14 +5,6 @@ This module provides centralized LLM client management with support
 for multiple providers (Anthropic, OpenAI, Azure OpenAI).
 """
 
-from src.core.llm_clients import (
-    get_llm_client,
-    get_available_providers,
-    validate_provider_config,
-    LLMClientManager,
-    ProviderType
-)
-
 __all__ = [
     'get_llm_client',
     'get_available_providers',
@@ -20,3 +12,13 @@ __all__ = [
     'LLMClientManager',
     'ProviderType'
 ]
+
+
+def __getattr__(name):
+    # Defer loading llm_clients (and config) until a name is actually used
+    if name in __all__:
+        from src.core import llm_clients
+        value = getattr(llm_clients, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,29 @@
+"""
+JSON helpers backed by orjson when available.
+
+orjson is installed with langsmith on CPython; elsewhere the stdlib json
+module is used with equivalent options (UTF-8 output, 2-space indent).
+Decode errors are json.JSONDecodeError in both cases.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_indented(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Pretty-print obj as JSON with a 2-space indent and unescaped non-ASCII."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=default).decode()
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False)
+
+
+def loads(data: str) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -18,23 +18,61 @@ Usage:
     llm = get_llm_client(provider="azure")
 """
 
-from typing import Optional, Literal
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI, AzureChatOpenAI
-import config
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Literal
+from config import CONFIG, ensure_validated
+
+# Provider SDKs are imported in the _create_*_client methods, so only the
+# provider actually used gets loaded
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+    from langchain_openai import ChatOpenAI, AzureChatOpenAI
 
 
 # Type alias for supported providers
 ProviderType = Literal["anthropic", "openai", "azure"]
 
+# Provider -> CONFIG attribute holding its default model, and provider ->
+# client factory method name; plain lookups instead of if/elif chains
+_DEFAULT_MODEL_SETTINGS = {
+    "anthropic": "ANTHROPIC_DEFAULT_MODEL",
+    "openai": "OPENAI_DEFAULT_MODEL",
+    "azure": "AZURE_OPENAI_DEPLOYMENT_NAME",
+}
+_CLIENT_FACTORIES = {
+    "anthropic": "_create_anthropic_client",
+    "openai": "_create_openai_client",
+    "azure": "_create_azure_client",
+}
+
 
 class LLMClientManager:
     """Manager class for LLM clients with provider switching capabilities."""
 
     def __init__(self):
         """Initialize the LLM client manager."""
-        self.default_provider = config.DEFAULT_LLM_PROVIDER
-        self.default_model = config.DEFAULT_LLM_MODEL
+        self.default_provider = CONFIG.DEFAULT_LLM_PROVIDER
+        self.default_model = CONFIG.DEFAULT_LLM_MODEL
+        # Built clients by settings; reusing one keeps its HTTP connection pool warm
+        self._clients: Dict[tuple, Any] = {}
+
+        # Credentials are checked and read once; the _create_*_client methods
+        # only add the per-call fields. A provider missing here is not configured.
+        self._provider_base_kwargs: Dict[str, Dict[str, Any]] = {}
+        if CONFIG.ANTHROPIC_API_KEY:
+            self._provider_base_kwargs["anthropic"] = {
+                "anthropic_api_key": CONFIG.ANTHROPIC_API_KEY,
+            }
+        if CONFIG.OPENAI_API_KEY:
+            self._provider_base_kwargs["openai"] = {
+                "openai_api_key": CONFIG.OPENAI_API_KEY,
+            }
+        if all([CONFIG.AZURE_OPENAI_API_KEY, CONFIG.AZURE_OPENAI_ENDPOINT, CONFIG.AZURE_OPENAI_API_VERSION]):
+            self._provider_base_kwargs["azure"] = {
+                "openai_api_version": CONFIG.AZURE_OPENAI_API_VERSION,
+                "azure_endpoint": CONFIG.AZURE_OPENAI_ENDPOINT,
+                "api_key": CONFIG.AZURE_OPENAI_API_KEY,
+            }
 
     def get_client(
         self,
@@ -71,6 +109,9 @@ class LLMClientManager:
             # Use Azure OpenAI
             llm = manager.get_client(provider="azure")
         """
+        # Validate provider configuration on first client construction
+        ensure_validated()
+
         # Use default provider if not specified
         if provider is None:
             provider = self.default_provider
@@ -79,25 +120,44 @@ class LLMClientManager:
         if model is None:
             model = self._get_default_model(provider)
 
+        try:
+            key = (provider, model, temperature, max_tokens, frozenset(kwargs.items()))
+        except TypeError:
+            # Unhashable kwargs: build a fresh client
+            return self._create_client(provider, model, temperature, max_tokens, **kwargs)
+
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients.setdefault(
+                key, self._create_client(provider, model, temperature, max_tokens, **kwargs)
+            )
+        return client
+
+    def cache_clear(self):
+        """Drop all cached clients (e.g. after changing credentials in tests)."""
+        self._clients.clear()
+
+    def _create_client(
+        self,
+        provider: ProviderType,
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        **kwargs
+    ):
+        """Build a new client for the given provider."""
         # Route to appropriate client creation method
-        if provider == "anthropic":
-            return self._create_anthropic_client(model, temperature, max_tokens, **kwargs)
-        elif provider == "openai":
-            return self._create_openai_client(model, temperature, max_tokens, **kwargs)
-        elif provider == "azure":
-            return self._create_azure_client(model, temperature, max_tokens, **kwargs)
-        else:
+        factory = _CLIENT_FACTORIES.get(provider)
+        if factory is None:
             raise ValueError(f"Unsupported provider: {provider}. Use 'anthropic', 'openai', or 'azure'.")
+        return getattr(self, factory)(model, temperature, max_tokens, **kwargs)
 
     def _get_default_model(self, provider: ProviderType) -> str:
         """Get the default model for a given provider."""
-        if provider == "anthropic":
-            return config.ANTHROPIC_DEFAULT_MODEL
-        elif provider == "openai":
-            return config.OPENAI_DEFAULT_MODEL
-        elif provider == "azure":
-            return config.AZURE_OPENAI_DEPLOYMENT_NAME
-        return self.default_model
+        setting = _DEFAULT_MODEL_SETTINGS.get(provider)
+        if setting is None:
+            return self.default_model
+        return getattr(CONFIG, setting)
 
     def _create_anthropic_client(
         self,
@@ -105,15 +165,17 @@ class LLMClientManager:
         temperature: float,
         max_tokens: Optional[int],
         **kwargs
-    ) -> ChatAnthropic:
+    ) -> "ChatAnthropic":
         """Create an Anthropic (Claude) client."""
-        api_key = config.ANTHROPIC_API_KEY
-        if not api_key:
+        from langchain_anthropic import ChatAnthropic
+
+        base_kwargs = self._provider_base_kwargs.get("anthropic")
+        if base_kwargs is None:
             raise ValueError("ANTHROPIC_API_KEY not set in environment variables.")
 
         client_kwargs = {
+            **base_kwargs,
             "model": model,
-            "anthropic_api_key": api_key,
             "temperature": temperature,
         }
 
@@ -131,15 +193,17 @@ class LLMClientManager:
         temperature: float,
         max_tokens: Optional[int],
         **kwargs
-    ) -> ChatOpenAI:
+    ) -> "ChatOpenAI":
         """Create an OpenAI client."""
-        api_key = config.OPENAI_API_KEY
-        if not api_key:
+        from langchain_openai import ChatOpenAI
+
+        base_kwargs = self._provider_base_kwargs.get("openai")
+        if base_kwargs is None:
             raise ValueError("OPENAI_API_KEY not set in environment variables.")
 
         client_kwargs = {
+            **base_kwargs,
             "model": model,
-            "openai_api_key": api_key,
             "temperature": temperature,
         }
 
@@ -157,24 +221,22 @@ class LLMClientManager:
         temperature: float,
         max_tokens: Optional[int],
         **kwargs
-    ) -> AzureChatOpenAI:
+    ) -> "AzureChatOpenAI":
         """Create an Azure OpenAI client."""
-        api_key = config.AZURE_OPENAI_API_KEY
-        endpoint = config.AZURE_OPENAI_ENDPOINT
-        api_version = config.AZURE_OPENAI_API_VERSION
+        from langchain_openai import AzureChatOpenAI
+
+        base_kwargs = self._provider_base_kwargs.get("azure")
         deployment_name = model  # In Azure, the model is the deployment name
 
-        if not all([api_key, endpoint, api_version, deployment_name]):
+        if base_kwargs is None or not deployment_name:
             raise ValueError(
                 "Azure OpenAI requires AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, "
                 "AZURE_OPENAI_API_VERSION, and AZURE_OPENAI_DEPLOYMENT_NAME to be set."
             )
 
         client_kwargs = {
+            **base_kwargs,
             "azure_deployment": deployment_name,
-            "openai_api_version": api_version,
-            "azure_endpoint": endpoint,
-            "api_key": api_key,
             "temperature": temperature,
         }
 
@@ -187,8 +249,11 @@ class LLMClientManager:
         return AzureChatOpenAI(**client_kwargs)
 
 
-# Global instance for convenience
-_manager = LLMClientManager()
+# Global instance for convenience; created on first use so importing this
+# module doesn't read provider settings
+@lru_cache(maxsize=1)
+def _get_manager() -> LLMClientManager:
+    return LLMClientManager()
 
 
 def get_llm_client(
@@ -212,7 +277,8 @@ def get_llm_client(
         **kwargs: Additional provider-specific arguments.
 
     Returns:
-        A LangChain chat model instance.
+        A LangChain chat model instance, shared between calls with the same
+        settings. Call get_llm_client.cache_clear() to force new clients.
 
     Examples:
         # Use default provider and model
@@ -228,7 +294,15 @@ def get_llm_client(
         # Use Azure OpenAI with custom settings
         llm = get_llm_client(provider="azure", temperature=0.5, max_tokens=2000)
     """
-    return _manager.get_client(provider, model, temperature, max_tokens, **kwargs)
+    return _get_manager().get_client(provider, model, temperature, max_tokens, **kwargs)
+
+
+def _cache_clear():
+    """Drop cached clients and responses (exposed as get_llm_client.cache_clear)."""
+    _get_manager().cache_clear()
+
+
+get_llm_client.cache_clear = _cache_clear
 
 
 def get_available_providers() -> list[str]:
@@ -241,19 +315,19 @@ def get_available_providers() -> list[str]:
     available = []
 
     # Check Anthropic
-    if config.ANTHROPIC_API_KEY:
+    if CONFIG.ANTHROPIC_API_KEY:
         available.append("anthropic")
 
     # Check OpenAI
-    if config.OPENAI_API_KEY:
+    if CONFIG.OPENAI_API_KEY:
         available.append("openai")
 
     # Check Azure OpenAI
     if all([
-        config.AZURE_OPENAI_API_KEY,
-        config.AZURE_OPENAI_ENDPOINT,
-        config.AZURE_OPENAI_API_VERSION,
-        config.AZURE_OPENAI_DEPLOYMENT_NAME
+        CONFIG.AZURE_OPENAI_API_KEY,
+        CONFIG.AZURE_OPENAI_ENDPOINT,
+        CONFIG.AZURE_OPENAI_API_VERSION,
+        CONFIG.AZURE_OPENAI_DEPLOYMENT_NAME
     ]):
         available.append("azure")
 
@@ -271,24 +345,24 @@ def validate_provider_config(provider: ProviderType) -> tuple[bool, Optional[str
         Tuple of (is_valid, error_message)
     """
     if provider == "anthropic":
-        if not config.ANTHROPIC_API_KEY:
+        if not CONFIG.ANTHROPIC_API_KEY:
             return False, "ANTHROPIC_API_KEY not set in environment variables"
         return True, None
 
     elif provider == "openai":
-        if not config.OPENAI_API_KEY:
+        if not CONFIG.OPENAI_API_KEY:
             return False, "OPENAI_API_KEY not set in environment variables"
         return True, None
 
     elif provider == "azure":
         missing = []
-        if not config.AZURE_OPENAI_API_KEY:
+        if not CONFIG.AZURE_OPENAI_API_KEY:
             missing.append("AZURE_OPENAI_API_KEY")
-        if not config.AZURE_OPENAI_ENDPOINT:
+        if not CONFIG.AZURE_OPENAI_ENDPOINT:
             missing.append("AZURE_OPENAI_ENDPOINT")
-        if not config.AZURE_OPENAI_API_VERSION:
+        if not CONFIG.AZURE_OPENAI_API_VERSION:
             missing.append("AZURE_OPENAI_API_VERSION")
-        if not config.AZURE_OPENAI_DEPLOYMENT_NAME:
+        if not CONFIG.AZURE_OPENAI_DEPLOYMENT_NAME:
             missing.append("AZURE_OPENAI_DEPLOYMENT_NAME")
 
         if missing:
@@ -0,0 +1,185 @@
+"""
+Semantic response cache for section generation.
+
+Prompts are embedded locally (sentence-transformers, optional dependency) and
+compared by cosine similarity with earlier prompts in the same namespace
+(contract type and section). A match at or above the threshold returns the stored
+response instead of calling the LLM. Entries expire after a TTL.
+
+embed_text() exposes the same local model with a SHA-256 keyed LRU of
+query embeddings, for knowledge base semantic search.
+
+Usage:
+    from src.core.semantic_cache import get_semantic_cache
+
+    cache = get_semantic_cache()  # None if disabled or not installed
+    if cache is not None:
+        text, vector = cache.lookup("SITE_SUPERVISION:§3", prompt)
+        if text is None:
+            text = llm.invoke(...).content
+            cache.store("SITE_SUPERVISION:§3", vector, text)
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import CONFIG
+
+
+# Small local embedding model; good enough to spot near-duplicate prompts
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Query embeddings kept by embed_text()
+EMBEDDING_CACHE_MAXSIZE = 512
+
+
+class SemanticCache:
+    """In-memory cache of (prompt embedding -> response), per namespace."""
+
+    def __init__(self, embed: Callable[[str], np.ndarray], threshold: float = 0.92, ttl: float = 300.0):
+        """
+        Args:
+            embed: Function returning the embedding vector of a text
+            threshold: Minimum cosine similarity for a hit
+            ttl: Seconds an entry stays valid
+        """
+        self._embed = embed
+        self.threshold = threshold
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # namespace -> (normalized embeddings as rows, responses, insert times)
+        self._entries: Dict[str, Tuple[np.ndarray, List[str], List[float]]] = {}
+
+    def _vector(self, text: str) -> np.ndarray:
+        vector = np.asarray(self._embed(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _expire(self, namespace: str, now: float) -> None:
+        entry = self._entries.get(namespace)
+        if entry is None:
+            return
+        matrix, responses, times = entry
+        keep = [i for i, t in enumerate(times) if now - t < self.ttl]
+        if len(keep) == len(times):
+            return
+        if not keep:
+            del self._entries[namespace]
+            return
+        self._entries[namespace] = (
+            matrix[keep],
+            [responses[i] for i in keep],
+            [times[i] for i in keep],
+        )
+
+    def lookup(self, namespace: str, prompt: str) -> Tuple[Optional[str], np.ndarray]:
+        """
+        Find a cached response for a similar prompt.
+
+        Returns:
+            (response or None, prompt embedding). Pass the embedding to
+            store() on a miss so the prompt isn't embedded twice.
+        """
+        vector = self._vector(prompt)
+        with self._lock:
+            self._expire(namespace, time.monotonic())
+            entry = self._entries.get(namespace)
+            if entry is None:
+                return None, vector
+            matrix, responses, _ = entry
+            # Rows and query are unit length, so the dot product is the cosine
+            scores = matrix @ vector
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return responses[best], vector
+        return None, vector
+
+    def store(self, namespace: str, vector: np.ndarray, response: str) -> None:
+        """Add a response under the embedding returned by lookup()."""
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(namespace)
+            if entry is None:
+                self._entries[namespace] = (vector[np.newaxis, :], [response], [now])
+            else:
+                matrix, responses, times = entry
+                self._entries[namespace] = (
+                    np.vstack([matrix, vector]),
+                    responses + [response],
+                    times + [now],
+                )
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_model():
+    """Local sentence-transformers model, or None if not installed."""
+    # Import here to avoid errors if sentence-transformers is not installed
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        print("⚠️ sentence-transformers not installed - semantic features disabled")
+        return None
+
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_embeddings_lock = threading.Lock()
+
+
+def embed_text(text: str) -> Optional[np.ndarray]:
+    """
+    Normalized embedding of a text, cached by its SHA-256 digest.
+
+    Repeated texts (e.g. the same project description across drafting
+    iterations) are embedded once. Returns None if sentence-transformers
+    is not installed.
+    """
+    key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    with _embeddings_lock:
+        vector = _embeddings.get(key)
+        if vector is not None:
+            _embeddings.move_to_end(key)
+            return vector
+
+    model = _get_embedding_model()
+    if model is None:
+        return None
+    vector = model.encode(text, normalize_embeddings=True)
+
+    with _embeddings_lock:
+        _embeddings[key] = vector
+        if len(_embeddings) > EMBEDDING_CACHE_MAXSIZE:
+            _embeddings.popitem(last=False)
+    return vector
+
+
+@lru_cache(maxsize=1)
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Shared semantic cache, or None when SEMANTIC_CACHE_ENABLED is off or
+    sentence-transformers is not installed.
+    """
+    if not CONFIG.SEMANTIC_CACHE_ENABLED:
+        return None
+
+    model = _get_embedding_model()
+    if model is None:
+        return None
+
+    return SemanticCache(
+        model.encode,
+        threshold=CONFIG.SEMANTIC_CACHE_THRESHOLD,
+        ttl=CONFIG.SEMANTIC_CACHE_TTL,
+    )
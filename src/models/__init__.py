@@ -1,19 +1,24 @@
 """Data models for contract generation system."""
 
-from .state import ContractState
-from .contract import (
-    ContractParty,
-    PerformanceItem,
-    ContractData,
-    VerhandlungsprotokollData,
-    LeistungsverzeichnisData
-)
+from importlib import import_module
 
-__all__ = [
-    'ContractState',
-    'ContractParty',
-    'PerformanceItem',
-    'ContractData',
-    'VerhandlungsprotokollData',
-    'LeistungsverzeichnisData'
-]
\ No newline at end of file
+# Public name -> submodule; resolved on first access (PEP 562) so importing
+# one model module doesn't pull in the others and their dependencies.
+_EXPORTS = {
+    'ContractState': '.state',
+    'ContractParty': '.contract',
+    'PerformanceItem': '.contract',
+    'ContractData': '.contract',
+    'VerhandlungsprotokollData': '.contract',
+    'LeistungsverzeichnisData': '.contract',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,32 @@
 """Contract data models for validation and structure."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import date
-from decimal import Decimal
+
+
+def _iso_date(value: Any) -> Any:
+    """
+    Fast path for ISO date strings (what the extractors produce); anything
+    else, or a string fromisoformat rejects, goes on to Pydantic's parser.
+    """
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
+
+
+# Value objects below are validated once where they are extracted, then
+# passed between nodes by reference; frozen makes that sharing safe.
 
 
 class ContractParty(BaseModel):
     """Represents a party in the contract (contractor/subcontractor)."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Company name")
     address: str = Field(..., description="Full address")
     registration_number: Optional[str] = Field(None, description="Company registration number")
@@ -21,6 +39,8 @@ class ContractParty(BaseModel):
 class PerformanceItem(BaseModel):
     """Represents a single performance item/position from Leistungsverzeichnis."""
 
+    model_config = ConfigDict(frozen=True)
+
     position_number: str = Field(..., description="Position/item number")
     description: str = Field(..., description="Description of work/service")
     quantity: float = Field(..., description="Quantity")
@@ -31,19 +51,24 @@ class PerformanceItem(BaseModel):
 
     @field_validator('total_price')
     @classmethod
-    def validate_total_price(cls, v: float, values: Dict[str, Any]) -> float:
+    def validate_total_price(cls, v: float, info: ValidationInfo) -> float:
         """Validate that total price matches quantity * unit_price."""
-        if 'quantity' in values.data and 'unit_price' in values.data:
-            expected = round(values.data['quantity'] * values.data['unit_price'], 2)
-            if abs(v - expected) > 0.01:  # Allow for small rounding differences
+        quantity = info.data.get('quantity')
+        unit_price = info.data.get('unit_price')
+        if quantity is not None and unit_price is not None:
+            # Compare in whole cents: exact integer check, no float tolerance
+            expected_cents = round(quantity * unit_price * 100)
+            if round(v * 100) != expected_cents:
                 # Auto-correct the total price
-                return expected
+                return expected_cents / 100
         return v
 
 
 class PaymentTerms(BaseModel):
     """Payment terms structure."""
 
+    model_config = ConfigDict(frozen=True)
+
     payment_schedule: str = Field(..., description="Payment schedule description")
     advance_payment: Optional[float] = Field(None, description="Advance payment percentage")
     retention: Optional[float] = Field(None, description="Retention percentage")
@@ -77,6 +102,10 @@ class VerhandlungsprotokollData(BaseModel):
     penalties: Optional[str] = Field(None, description="Penalty clauses")
     quality_standards: Optional[str] = Field(None, description="Required quality standards")
 
+    _parse_dates = field_validator(
+        'negotiation_date', 'contract_start_date', 'contract_end_date', mode='before'
+    )(_iso_date)
+
 
 class LeistungsverzeichnisData(BaseModel):
     """Structured data extracted from Leistungsverzeichnis (bill of quantities)."""
@@ -95,14 +124,18 @@ class LeistungsverzeichnisData(BaseModel):
     currency: str = Field("EUR", description="Currency")
     notes: Optional[str] = Field(None, description="Additional notes")
 
+    _parse_dates = field_validator('creation_date', mode='before')(_iso_date)
+
     @field_validator('total_amount')
     @classmethod
-    def validate_total_amount(cls, v: float, values: Dict[str, Any]) -> float:
+    def validate_total_amount(cls, v: float, info: ValidationInfo) -> float:
         """Validate that total amount matches subtotal + tax."""
-        if 'subtotal' in values.data and 'tax_amount' in values.data:
-            expected = round(values.data['subtotal'] + values.data['tax_amount'], 2)
-            if abs(v - expected) > 0.01:
-                return expected
+        subtotal = info.data.get('subtotal')
+        tax_amount = info.data.get('tax_amount')
+        if subtotal is not None and tax_amount is not None:
+            expected_cents = round(subtotal * 100) + round(tax_amount * 100)
+            if round(v * 100) != expected_cents:
+                return expected_cents / 100
         return v
 
 
@@ -149,4 +182,8 @@ class ContractData(BaseModel):
 
     # Metadata
     generated_date: date = Field(default_factory=date.today)
-    version: str = "1.0"
\ No newline at end of file
+    version: str = "1.0"
+
+    _parse_dates = field_validator(
+        'contract_date', 'start_date', 'end_date', 'generated_date', mode='before'
+    )(_iso_date)
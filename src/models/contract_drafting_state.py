@@ -1,5 +1,6 @@
 """State definition for general contract drafting workflow."""
 
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any, Annotated
 from typing_extensions import TypedDict
 from langgraph.graph.message import add_messages
@@ -12,9 +13,21 @@ def merge_steps(left: str, right: str) -> str:
         return right
     if not right:
         return left
-    # Merge parallel steps
-    steps = set(left.split(" + ")) | set(right.split(" + "))
-    return " + ".join(sorted(steps))
+    left_steps = left.split(" + ")
+    # Same step again (e.g. one update per parallel section task)
+    if right in left_steps:
+        return left
+    # Merge parallel steps, keeping the order they were reported in
+    return " + ".join(dict.fromkeys(left_steps + right.split(" + ")))
+
+
+def merge_sections(left: Dict[str, str], right: Dict[str, str]) -> Dict[str, str]:
+    """Reducer for generated_sections: merges sections written in parallel."""
+    if not left:
+        return right
+    if not right:
+        return left
+    return {**left, **right}
 
 
 class ContractDraftingState(TypedDict):
@@ -35,6 +48,7 @@ class ContractDraftingState(TypedDict):
 
     # For backward compatibility with existing extractors
     pdf_path: Optional[str]
+    pdf_paths: Optional[List[str]]  # All uploaded Verhandlungsprotokoll documents
     excel_path: Optional[str]
 
     # ===== [3] Knowledge Base Data (fetched from Supabase) =====
@@ -49,7 +63,7 @@ class ContractDraftingState(TypedDict):
     section_mappings: Dict[str, Dict[str, Any]]  # Data → Sections
 
     # ===== [6] Generation =====
-    generated_sections: Dict[str, str]  # Section number → text
+    generated_sections: Annotated[Dict[str, str], merge_sections]  # Section number → text (one writer per section)
     contract_draft: str  # Full contract text
 
     # ===== [7] Consistency =====
@@ -73,3 +87,50 @@ class ContractDraftingState(TypedDict):
     # ===== Metadata =====
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
+
+
+# Read-only prototype of the scalar fields every run starts with. Containers
+# are not shared between runs: _fresh_containers() builds them per call.
+_INITIAL_STATE_PROTOTYPE = MappingProxyType({
+    "quality_score": 0.0,
+    "quality_passed": False,
+    "current_step": "",
+    "processing_status": "initialized",
+})
+
+
+def _fresh_containers() -> Dict[str, Any]:
+    """New empty lists/dicts for the container fields of one run."""
+    return {
+        "messages": [],
+        "errors": [],
+        "retrieved_contracts": [],
+        "retrieved_clauses": [],
+        "contract_structures": [],
+        "consistency_issues": [],
+        "output_files": {},
+        "generated_sections": {},
+        "section_mappings": {},
+        "contract_outline": [],
+        "quality_report": {},
+    }
+
+
+def create_initial_state(**fields: Any) -> ContractDraftingState:
+    """
+    Build the initial workflow state from the shared prototype and fresh
+    containers.
+
+    Args:
+        **fields: Per-run values (contract_type_id, project_description,
+            uploaded_documents, ...) overriding the prototype defaults.
+            created_at/updated_at default to a single shared timestamp.
+
+    Returns:
+        State dict ready for graph.invoke()
+    """
+    if "created_at" not in fields or "updated_at" not in fields:
+        now = datetime.now()
+        fields.setdefault("created_at", now)
+        fields.setdefault("updated_at", now)
+    return {**_INITIAL_STATE_PROTOTYPE, **_fresh_containers(), **fields}
@@ -14,6 +14,7 @@ class ContractState(TypedDict):
     # File handling
     uploaded_files: Dict[str, str]  # {file_type: file_path}
     pdf_path: Optional[str]
+    pdf_paths: Optional[List[str]]  # Several Verhandlungsprotokoll documents
     excel_path: Optional[str]
 
     # Extracted raw data
@@ -1,23 +1,30 @@
 """LangGraph nodes for contract generation workflow."""
 
-from .upload_handler import upload_handler_node
-from .document_classifier import document_classifier_node
-from .document_extractor import document_extractor_node
-from .excel_extractor import excel_extractor_node
-from .data_validator import data_validator_node
-from .data_merger import data_merger_node
-from .contract_generator import contract_generator_node
-from .quality_checker import quality_checker_node
-from .output_formatter import output_formatter_node
+from importlib import import_module
 
-__all__ = [
-    'upload_handler_node',
-    'document_classifier_node',
-    'document_extractor_node',
-    'excel_extractor_node',
-    'data_validator_node',
-    'data_merger_node',
-    'contract_generator_node',
-    'quality_checker_node',
-    'output_formatter_node'
-]
\ No newline at end of file
+# Public name -> submodule; resolved on first access (PEP 562) so importing a
+# single node (or the contract_drafting subpackage) doesn't load pdfplumber,
+# pandas and the LLM SDKs for all of them.
+_EXPORTS = {
+    'upload_handler_node': '.upload_handler',
+    'document_classifier_node': '.document_classifier',
+    'document_extractor_node': '.document_extractor',
+    'adocument_extractor_node': '.document_extractor',
+    'excel_extractor_node': '.excel_extractor',
+    'aexcel_extractor_node': '.excel_extractor',
+    'data_validator_node': '.data_validator',
+    'data_merger_node': '.data_merger',
+    'contract_generator_node': '.contract_generator',
+    'quality_checker_node': '.quality_checker',
+    'output_formatter_node': '.output_formatter',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,31 @@
 """Contract drafting nodes for general construction contracts."""
 
 from .user_input_handler import user_input_handler_node
-from .knowledge_base_fetcher import knowledge_base_fetcher_node
+from .knowledge_base_fetcher import knowledge_base_fetcher_node, aknowledge_base_fetcher_node
 from .structure_analyzer import structure_analyzer_node
 from .content_mapper import content_mapper_node
-from .clause_generator import clause_generator_node
+from .clause_generator import (
+    route_clause_sections,
+    clause_section_node,
+    aclause_section_node,
+    clause_aggregator_node,
+)
 from .consistency_checker import consistency_checker_node
 from .quality_reviewer import quality_reviewer_node
-from .output_formatter import output_formatter_node
+from .output_formatter import output_formatter_node, aoutput_formatter_node
 
 __all__ = [
     "user_input_handler_node",
     "knowledge_base_fetcher_node",
+    "aknowledge_base_fetcher_node",
     "structure_analyzer_node",
     "content_mapper_node",
-    "clause_generator_node",
+    "route_clause_sections",
+    "clause_section_node",
+    "aclause_section_node",
+    "clause_aggregator_node",
     "consistency_checker_node",
     "quality_reviewer_node",
     "output_formatter_node",
+    "aoutput_formatter_node",
 ]
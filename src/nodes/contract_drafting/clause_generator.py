@@ -1,37 +1,57 @@
-"""Clause generator node for generating contract sections."""
+"""Clause generator nodes for generating contract sections.
 
-import json
-from typing import Dict, Any
+Sections are generated in parallel (fork-join):
+- route_clause_sections fans out one Send per outline section
+- clause_section_node writes a single section
+- clause_aggregator_node joins the results into the full contract draft
+"""
+
+import asyncio
+from typing import Dict, Any, List, Union
+from langgraph.types import Send
+from src.core.json_utils import dumps_indented
 from src.core.llm_clients import get_llm_client
+from src.core.semantic_cache import get_semantic_cache
 from src.models.contract_drafting_state import ContractDraftingState
+from .utils import party_name
+
+
+RULE = "=" * 80
+SECTION_RULE = "-" * 60 + "\n\n"
+SIGNATURE_BLOCK = "_" * 40 + "\nOrt, Datum / Place, Date\n\n" + "_" * 40 + "\nUnterschrift / Signature"
+
+SECTION_SYSTEM_PROMPT = "You are an expert in drafting German construction contracts. Write precise, legally sound contract text."
+
+
+def _sorted_outline(state: ContractDraftingState) -> List[Dict[str, Any]]:
+    """Outline sections ordered by priority."""
+    return sorted(state.get("contract_outline", []), key=lambda x: x.get("priority", 999))
 
 
-def clause_generator_node(state: ContractDraftingState) -> Dict[str, Any]:
+def _predicted_length(section: Dict[str, Any], mapping: Dict[str, Any]) -> float:
+    """Rough expected length of a section's text (more data, longer text)."""
+    return min(2000, 400 + 50 * len(mapping.get("available_data", [])) + len(section.get("description", "")) / 2)
+
+
+def route_clause_sections(state: ContractDraftingState) -> Union[List[Send], str]:
     """
-    Generate contract sections iteratively.
+    Fan out one clause_section task per outline section.
 
-    Generates each section using:
-    - Contract type data and policies
-    - Extracted data from documents
-    - Historical clause examples
-    - Context from previously generated sections
+    Each task gets its fully built prompt, so the section node doesn't need
+    the workflow state. Sections are independent of each other: instead of
+    the text of previously generated sections, every prompt lists the other
+    section titles so the model keeps to its own scope. Sections expected
+    to be longest are sent first.
 
     Args:
         state: Current workflow state
 
     Returns:
-        Updates to state with generated sections and full contract draft
+        Send packets for clause_section, or "clause_aggregator" if the
+        outline is empty
     """
     print("✍️ Generating contract clauses...")
 
-    updates = {
-        "current_step": "clause_generator",
-        "messages": [],
-        "generated_sections": {},
-        "contract_draft": ""
-    }
-
-    outline = state.get("contract_outline", [])
     section_mappings = state.get("section_mappings", {})
     retrieved_clauses = state.get("retrieved_clauses", [])
     vp_data = state.get("verhandlungsprotokoll_data", {}) or {}
@@ -39,19 +59,31 @@ def clause_generator_node(state: ContractDraftingState) -> Dict[str, Any]:
     contract_type_data = state.get("contract_type_data", {})
     project_description = state.get("project_description", "")
 
-    llm = get_llm_client()
-    generated_sections = {}
-
-    # Sort by priority
-    sorted_outline = sorted(outline, key=lambda x: x.get("priority", 999))
-
-    for idx, section in enumerate(sorted_outline):
+    sorted_outline = _sorted_outline(state)
+    if not sorted_outline:
+        return "clause_aggregator"
+
+    # Prompt fragments shared by all sections
+    contract_type_header = (
+        f"Contract Type: {contract_type_data.get('name')} / {contract_type_data.get('name_de')}\n"
+        f"Contract Type Code: {contract_type_data.get('code')}"
+    )
+    project_excerpt = project_description[:500] if project_description else "Not provided"
+    contract_sections = "\n".join(
+        f"- {section['section_number']} {section['title_de']}" for section in sorted_outline
+    )
+
+    # Lowercase clause titles once instead of per section
+    clause_titles = [
+        (clause, clause.get("section_title", "").lower()) for clause in retrieved_clauses
+    ]
+
+    sends = []
+    for section in sorted_outline:
         section_num = section["section_number"]
         section_title = section["title_de"]
         section_desc = section.get("description", "")
 
-        print(f"  Generating {section_num} {section_title}...")
-
         # Get mapping for this section
         mapping = section_mappings.get(section_num, {})
 
@@ -65,34 +97,32 @@ def clause_generator_node(state: ContractDraftingState) -> Dict[str, Any]:
 
         # Get relevant example clauses
         relevant_clauses = []
-        if retrieved_clauses:
-            for clause in retrieved_clauses:
-                clause_title = clause.get("section_title", "").lower()
-                if section_title.lower() in clause_title or clause_title in section_title.lower():
-                    relevant_clauses.append(clause)
+        title_lower = section_title.lower()
+        for clause, clause_title in clause_titles:
+            if title_lower in clause_title or clause_title in title_lower:
+                relevant_clauses.append(clause)
                 if len(relevant_clauses) >= 2:
                     break
 
         # Build generation prompt
         prompt = f"""Generate contract section: {section_title} ({section_num})
 
-Contract Type: {contract_type_data.get('name')} / {contract_type_data.get('name_de')}
-Contract Type Code: {contract_type_data.get('code')}
+{contract_type_header}
 
 Project Description:
-{project_description[:500] if project_description else "Not provided"}
+{project_excerpt}
 
 Section Description:
 {section_desc}
 
 Available Data for this Section:
-{json.dumps(section_data, indent=2, default=str, ensure_ascii=False) if section_data else "No specific data available"}
+{dumps_indented(section_data, default=str) if section_data else "No specific data available"}
 
 {"Reference Clauses (for structure and style):" if relevant_clauses else ""}
 {chr(10).join([f"Example {i+1}: {c.get('clause_text', '')[:300]}..." for i, c in enumerate(relevant_clauses)]) if relevant_clauses else ""}
 
-Previously Generated Sections (for context):
-{json.dumps({k: v[:150] + "..." for k, v in list(generated_sections.items())[-2:]}, indent=2, ensure_ascii=False) if generated_sections else "This is the first section"}
+All Sections of this Contract (for context, do not repeat their content):
+{contract_sections}
 
 Instructions:
 1. Write in German legal language
@@ -100,68 +130,171 @@ Instructions:
 3. Follow structure from examples if provided
 4. Be specific and clear
 5. If critical information is missing, mark with [PRÜFUNG ERFORDERLICH: reason in German]
-6. Ensure consistency with previous sections (party names, terminology)
+6. Ensure consistency with the other sections (party names, terminology)
 7. Keep the section focused on {section_title}
 
 Generate ONLY the section text in German. No explanations, no preamble.
 """
+        sends.append((_predicted_length(section, mapping), Send("clause_section", {
+            "section_number": section_num,
+            "section_title": section_title,
+            "prompt": prompt,
+            # Semantic cache entries are only shared within one section of one
+            # contract type: section prompts share most of their text, so
+            # different sections could otherwise match each other
+            "namespace": f"{contract_type_data.get('code') or state.get('contract_type_id') or ''}:{section_num}",
+        })))
+
+    # Longest sections first: with max_concurrency < #sections, the long
+    # generations no longer start last and stretch the whole fan-out.
+    # Output order is unaffected (the aggregator follows the outline).
+    sends.sort(key=lambda item: item[0], reverse=True)
+    return [send for _, send in sends]
+
+
+def _section_failed(task: Dict[str, Any], error: Exception) -> str:
+    """Placeholder text for a section whose generation failed."""
+    print(f"  ⚠️ Failed to generate {task['section_number']}: {error}")
+    return f"[FEHLER BEI DER GENERIERUNG: {str(error)}]\n\n{task['section_title']}\n\n[Dieser Abschnitt muss manuell ergänzt werden]"
+
+
+def _section_messages(task: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Chat messages for one section task."""
+    return [
+        {"role": "system", "content": SECTION_SYSTEM_PROMPT},
+        {"role": "user", "content": task["prompt"]}
+    ]
+
+
+def _chunk_text(content: Union[str, List[Any]]) -> str:
+    """Text of a streamed message chunk (plain string or content blocks)."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
+
+def _section_update(task: Dict[str, Any], section_text: str) -> Dict[str, Any]:
+    """State update merging one section into generated_sections."""
+    return {
+        "current_step": "clause_generator",
+        "generated_sections": {task["section_number"]: section_text}
+    }
 
-        try:
-            response = llm.invoke([
-                {"role": "system", "content": "You are an expert in drafting German construction contracts. Write precise, legally sound contract text."},
-                {"role": "user", "content": prompt}
-            ])
 
-            section_text = response.content.strip()
-            generated_sections[section_num] = section_text
+def clause_section_node(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate a single contract section.
+
+    Args:
+        task: Send payload from route_clause_sections
+            (section_number, section_title, prompt, namespace)
+
+    Returns:
+        Updates merging this section into generated_sections
+    """
+    print(f"  Generating {task['section_number']} {task['section_title']}...")
+
+    cache = get_semantic_cache()
+    if cache is not None:
+        cached, vector = cache.lookup(task.get("namespace", ""), task["prompt"])
+        if cached is not None:
+            return _section_update(task, cached)
 
-        except Exception as e:
-            print(f"  ⚠️ Failed to generate {section_num}: {e}")
-            generated_sections[section_num] = f"[FEHLER BEI DER GENERIERUNG: {str(e)}]\n\n{section_title}\n\n[Dieser Abschnitt muss manuell ergänzt werden]"
+    try:
+        response = get_llm_client().invoke(_section_messages(task))
+        section_text = response.content.strip()
+    except Exception as e:
+        return _section_update(task, _section_failed(task, e))
 
-    # Compile full contract
-    contract_draft = f"""{'='*80}
+    if cache is not None:
+        cache.store(task.get("namespace", ""), vector, section_text)
+
+    return _section_update(task, section_text)
+
+
+async def aclause_section_node(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Async variant of clause_section_node (streams the LLM response)."""
+    print(f"  Generating {task['section_number']} {task['section_title']}...")
+
+    cache = get_semantic_cache()
+    if cache is not None:
+        # Embedding is CPU-bound; keep it off the event loop
+        cached, vector = await asyncio.to_thread(cache.lookup, task.get("namespace", ""), task["prompt"])
+        if cached is not None:
+            return _section_update(task, cached)
+
+    try:
+        # Stream so tokens reach graph.astream(stream_mode="messages") consumers
+        # while the section is still being written
+        chunks = []
+        async for chunk in get_llm_client().astream(_section_messages(task)):
+            chunks.append(_chunk_text(chunk.content))
+        section_text = "".join(chunks).strip()
+    except Exception as e:
+        return _section_update(task, _section_failed(task, e))
+
+    if cache is not None:
+        cache.store(task.get("namespace", ""), vector, section_text)
+
+    return _section_update(task, section_text)
+
+
+def clause_aggregator_node(state: ContractDraftingState) -> Dict[str, Any]:
+    """
+    Join the generated sections into the full contract draft.
+
+    Args:
+        state: Current workflow state (generated_sections merged from all
+            clause_section tasks)
+
+    Returns:
+        Updates to state with the full contract draft
+    """
+    updates = {
+        "current_step": "clause_generator",
+        "messages": [],
+        "contract_draft": ""
+    }
+
+    generated_sections = state.get("generated_sections", {})
+    vp_data = state.get("verhandlungsprotokoll_data", {}) or {}
+    contract_type_data = state.get("contract_type_data", {})
+    sorted_outline = _sorted_outline(state)
+
+    # Compile full contract (collect parts and join once)
+    parts = [f"""{RULE}
 {contract_type_data.get('name_de', contract_type_data.get('name'))}
-{'='*80}
+{RULE}
 
 Vertragstyp: {contract_type_data.get('name')}
 Code: {contract_type_data.get('code')}
 
-"""
+"""]
 
     for section in sorted_outline:
         section_num = section["section_number"]
         section_title = section["title_de"]
         section_text = generated_sections.get(section_num, "[NICHT GENERIERT]")
 
-        contract_draft += f"\n\n{section_num} {section_title}\n"
-        contract_draft += "-" * 60 + "\n\n"
-        contract_draft += section_text
+        parts.extend((f"\n\n{section_num} {section_title}\n", SECTION_RULE, section_text))
 
     # Add signature section
-    contract_draft += f"\n\n{'='*80}\n"
-    contract_draft += "UNTERSCHRIFTEN / SIGNATURES\n"
-    contract_draft += "=" * 80 + "\n\n"
+    parts.append(f"\n\n{RULE}\nUNTERSCHRIFTEN / SIGNATURES\n{RULE}\n\n")
+
+    contractor_name = party_name(vp_data, "contractor")
+    subcontractor_name = party_name(vp_data, "subcontractor")
 
     if vp_data.get("contractor"):
-        contractor = vp_data["contractor"]
-        contractor_name = contractor.get("name") if hasattr(contractor, "get") else getattr(contractor, "name", "")
-        contract_draft += f"Auftraggeber / Client:\n{contractor_name}\n\n"
-        contract_draft += "_" * 40 + "\n"
-        contract_draft += "Ort, Datum / Place, Date\n\n"
-        contract_draft += "_" * 40 + "\n"
-        contract_draft += "Unterschrift / Signature\n\n\n"
+        parts.append(f"Auftraggeber / Client:\n{contractor_name}\n\n{SIGNATURE_BLOCK}\n\n\n")
 
     if vp_data.get("subcontractor"):
-        subcontractor = vp_data["subcontractor"]
-        subcontractor_name = subcontractor.get("name") if hasattr(subcontractor, "get") else getattr(subcontractor, "name", "")
-        contract_draft += f"Auftragnehmer / Contractor:\n{subcontractor_name}\n\n"
-        contract_draft += "_" * 40 + "\n"
-        contract_draft += "Ort, Datum / Place, Date\n\n"
-        contract_draft += "_" * 40 + "\n"
-        contract_draft += "Unterschrift / Signature\n"
-
-    updates["generated_sections"] = generated_sections
+        parts.append(f"Auftragnehmer / Contractor:\n{subcontractor_name}\n\n{SIGNATURE_BLOCK}\n")
+
+    contract_draft = "".join(parts)
     updates["contract_draft"] = contract_draft
     updates["messages"].append({
         "role": "system",
@@ -1,8 +1,82 @@
 """Consistency checker node for validating contract coherence."""
 
 import re
-from typing import Dict, Any
+from typing import Dict, Any, List
 from src.models.contract_drafting_state import ContractDraftingState
+from .utils import party_name
+
+
+_REF_RE = re.compile(r'§\d+')
+
+# Review markers, one pattern per language
+_REVIEW_DE_RE = re.compile(r'\[PRÜFUNG ERFORDERLICH: ([^\]]+)\]')
+_REVIEW_EN_RE = re.compile(r'\[REVIEW NEEDED: ([^\]]+)\]')
+
+# Error markers and placeholders in one pass. Scanned separately from the
+# review markers, which may contain them (e.g. "[PRÜFUNG ERFORDERLICH: Summe [TODO]]")
+_FLAGS_RE = re.compile(
+    r'(?P<error>\[FEHLER|\[ERROR)'
+    r'|(?P<placeholder>\[TODO\]|\[TBD\]|\[XXXXX\]|\[\.\.\.\])'
+)
+
+PLACEHOLDERS = ("[TODO]", "[TBD]", "[XXXXX]", "[...]")
+
+
+def _find_literals(text: str, needles) -> set:
+    """
+    Return the needles that occur in text, scanning it once.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed.
+    Otherwise falls back to a longest-first regex alternation; a needle
+    only contained inside a longer match (e.g. "§1" inside "§10") is then
+    confirmed with a plain substring check.
+    """
+    needles = {n for n in needles if n}
+    if not needles:
+        return set()
+
+    # Import here to avoid errors if pyahocorasick is not installed
+    try:
+        import ahocorasick
+    except ImportError:
+        ahocorasick = None
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+        # iter() reports overlapping matches, so "§1" inside "§10" is found too
+        return {needle for _, needle in automaton.iter(text)}
+
+    pattern = re.compile("|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True)))
+    found = {m.group() for m in pattern.finditer(text)}
+    found.update(n for n in needles - found if n in text)
+    return found
+
+
+def _report(updates: Dict[str, Any], issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Store the issues and add the summary messages."""
+    updates["consistency_issues"] = issues
+
+    # Categorize issues by severity
+    critical = [i for i in issues if i["severity"] == "critical"]
+    high = [i for i in issues if i["severity"] == "high"]
+    medium = [i for i in issues if i["severity"] == "medium"]
+
+    updates["messages"].append({
+        "role": "system",
+        "content": f"✓ Consistency check complete: {len(issues)} issue(s) found "
+                  f"({len(critical)} critical, {len(high)} high, {len(medium)} medium)"
+    })
+
+    if critical:
+        updates["messages"].append({
+            "role": "system",
+            "content": f"⚠️ CRITICAL: {', '.join([i['message'] for i in critical[:3]])}"
+        })
+
+    return updates
 
 
 def consistency_checker_node(state: ContractDraftingState) -> Dict[str, Any]:
@@ -34,37 +108,53 @@ def consistency_checker_node(state: ContractDraftingState) -> Dict[str, Any]:
     vp_data = state.get("verhandlungsprotokoll_data", {}) or {}
     issues = []
 
-    # 1. Check cross-references
-    references = re.findall(r'§\d+', contract_draft)
-    if references:
-        # Get all section numbers from outline
-        valid_sections = {s["section_number"] for s in outline}
-
-        for ref in set(references):
-            if ref not in valid_sections:
-                issues.append({
-                    "type": "missing_reference",
-                    "reference": ref,
-                    "message": f"Reference to {ref} but section doesn't exist",
-                    "severity": "medium"
-                })
+    # Nothing to check against (e.g. clause generation produced no draft)
+    if not contract_draft.strip():
+        issues.append({
+            "type": "empty_draft",
+            "message": "Contract draft is empty",
+            "severity": "critical"
+        })
+        return _report(updates, issues)
 
-    # 2. Check for review markers
-    if "[PRÜFUNG ERFORDERLICH:" in contract_draft or "[REVIEW NEEDED:" in contract_draft:
-        review_items_de = re.findall(r'\[PRÜFUNG ERFORDERLICH: ([^\]]+)\]', contract_draft)
-        review_items_en = re.findall(r'\[REVIEW NEEDED: ([^\]]+)\]', contract_draft)
-        all_reviews = review_items_de + review_items_en
+    contractor_name = party_name(vp_data, "contractor")
+    subcontractor_name = party_name(vp_data, "subcontractor")
+
+    # Single scans of the draft: markers, then section numbers and party names
+    review_items_de = _REVIEW_DE_RE.findall(contract_draft)
+    review_items_en = _REVIEW_EN_RE.findall(contract_draft)
+    has_error = False
+    found_placeholders = set()
+    for match in _FLAGS_RE.finditer(contract_draft):
+        if match.group("error"):
+            has_error = True
+        else:
+            found_placeholders.add(match.group("placeholder"))
+
+    valid_sections = frozenset(s["section_number"] for s in outline)
+    present = _find_literals(contract_draft, valid_sections | {contractor_name, subcontractor_name})
 
-        for item in all_reviews:
+    # 1. Check cross-references
+    for ref in dict.fromkeys(_REF_RE.findall(contract_draft)):
+        if ref not in valid_sections:
             issues.append({
-                "type": "review_needed",
-                "item": item,
-                "message": f"Manual review required: {item}",
-                "severity": "high"
+                "type": "missing_reference",
+                "reference": ref,
+                "message": f"Reference to {ref} but section doesn't exist",
+                "severity": "medium"
             })
 
+    # 2. Check for review markers
+    for item in review_items_de + review_items_en:
+        issues.append({
+            "type": "review_needed",
+            "item": item,
+            "message": f"Manual review required: {item}",
+            "severity": "high"
+        })
+
     # 3. Check for error markers
-    if "[FEHLER" in contract_draft or "[ERROR" in contract_draft:
+    if has_error:
         issues.append({
             "type": "generation_error",
             "message": "Some sections have generation errors",
@@ -72,34 +162,26 @@ def consistency_checker_node(state: ContractDraftingState) -> Dict[str, Any]:
         })
 
     # 4. Check data consistency (party names)
-    if vp_data.get("contractor"):
-        contractor = vp_data["contractor"]
-        contractor_name = contractor.get("name") if hasattr(contractor, "get") else getattr(contractor, "name", "")
-
-        if contractor_name and contractor_name not in contract_draft:
-            issues.append({
-                "type": "missing_data",
-                "field": "contractor_name",
-                "message": f"Contractor name '{contractor_name}' not mentioned in contract",
-                "severity": "high"
-            })
-
-    if vp_data.get("subcontractor"):
-        subcontractor = vp_data["subcontractor"]
-        subcontractor_name = subcontractor.get("name") if hasattr(subcontractor, "get") else getattr(subcontractor, "name", "")
+    if contractor_name and contractor_name not in present:
+        issues.append({
+            "type": "missing_data",
+            "field": "contractor_name",
+            "message": f"Contractor name '{contractor_name}' not mentioned in contract",
+            "severity": "high"
+        })
 
-        if subcontractor_name and subcontractor_name not in contract_draft:
-            issues.append({
-                "type": "missing_data",
-                "field": "subcontractor_name",
-                "message": f"Subcontractor name '{subcontractor_name}' not mentioned in contract",
-                "severity": "high"
-            })
+    if subcontractor_name and subcontractor_name not in present:
+        issues.append({
+            "type": "missing_data",
+            "field": "subcontractor_name",
+            "message": f"Subcontractor name '{subcontractor_name}' not mentioned in contract",
+            "severity": "high"
+        })
 
     # 5. Check section completeness
     for section in outline:
         section_num = section["section_number"]
-        if section_num not in contract_draft:
+        if section_num not in present:
             issues.append({
                 "type": "missing_section",
                 "section": section_num,
@@ -108,32 +190,12 @@ def consistency_checker_node(state: ContractDraftingState) -> Dict[str, Any]:
             })
 
     # 6. Check for placeholder text
-    placeholders = ["[TODO]", "[TBD]", "[XXXXX]", "[...]"]
-    for placeholder in placeholders:
-        if placeholder in contract_draft:
+    for placeholder in PLACEHOLDERS:
+        if placeholder in found_placeholders:
             issues.append({
                 "type": "placeholder",
                 "message": f"Placeholder text found: {placeholder}",
                 "severity": "medium"
             })
 
-    updates["consistency_issues"] = issues
-
-    # Categorize issues by severity
-    critical = [i for i in issues if i["severity"] == "critical"]
-    high = [i for i in issues if i["severity"] == "high"]
-    medium = [i for i in issues if i["severity"] == "medium"]
-
-    updates["messages"].append({
-        "role": "system",
-        "content": f"✓ Consistency check complete: {len(issues)} issue(s) found "
-                  f"({len(critical)} critical, {len(high)} high, {len(medium)} medium)"
-    })
-
-    if critical:
-        updates["messages"].append({
-            "role": "system",
-            "content": f"⚠️ CRITICAL: {', '.join([i['message'] for i in critical[:3]])}"
-        })
-
-    return updates
+    return _report(updates, issues)
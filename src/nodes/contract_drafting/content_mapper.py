@@ -4,6 +4,38 @@ from typing import Dict, Any
 from src.models.contract_drafting_state import ContractDraftingState
 
 
+# (title keywords, data fields to offer) per section topic. "vp" and "lv"
+# refer to the Verhandlungsprotokoll / Leistungsverzeichnis data.
+# Keywords are matched as substrings so German compounds
+# ("Leistungsumfang", "Ausführungsfristen") are caught.
+SECTION_RULES = (
+    # Scope/Work sections
+    (("leistung", "scope", "work", "umfang"),
+     (("vp", "scope_of_work"), ("lv", "performance_items"), ("vp", "project_description"))),
+    # Payment/Remuneration sections
+    (("vergütung", "payment", "zahlung", "preis"),
+     (("vp", "payment_terms"), ("lv", "total_amount"), ("lv", "subtotal"))),
+    # Parties sections
+    (("partei", "parties", "vertragspartner"),
+     (("vp", "contractor"), ("vp", "subcontractor"))),
+    # Dates/Timeline sections
+    (("frist", "termin", "deadline", "date", "zeit"),
+     (("vp", "contract_start_date"), ("vp", "contract_end_date"), ("vp", "negotiation_date"))),
+    # Project info sections
+    (("projekt", "project", "bauvorhaben"),
+     (("vp", "project_name"), ("vp", "project_location"), ("vp", "project_description"))),
+    # Quality/Standards sections
+    (("qualität", "quality", "standard"),
+     (("vp", "quality_standards"),)),
+    # Warranty sections
+    (("gewährleistung", "warranty", "mängel"),
+     (("vp", "warranty_period_months"),)),
+    # Insurance sections
+    (("versicherung", "insurance", "haftung"),
+     (("vp", "insurance_requirements"),)),
+)
+
+
 def content_mapper_node(state: ContractDraftingState) -> Dict[str, Any]:
     """
     Map extracted data to contract sections.
@@ -27,6 +59,7 @@ def content_mapper_node(state: ContractDraftingState) -> Dict[str, Any]:
     outline = state.get("contract_outline", [])
     vp_data = state.get("verhandlungsprotokoll_data", {}) or {}
     lv_data = state.get("leistungsverzeichnis_data", {}) or {}
+    data_sources = {"vp": vp_data, "lv": lv_data}
 
     section_mappings = {}
 
@@ -43,66 +76,13 @@ def content_mapper_node(state: ContractDraftingState) -> Dict[str, Any]:
             "priority": section.get("priority", 999)
         }
 
-        # Simple mapping logic based on section content
+        # Table-driven mapping based on section title keywords
         title_lower = section_title.lower()
-
-        # Scope/Work sections
-        if any(keyword in title_lower for keyword in ["leistung", "scope", "work", "umfang"]):
-            if vp_data.get("scope_of_work"):
-                mapping["available_data"].append("scope_of_work")
-            if lv_data.get("performance_items"):
-                mapping["available_data"].append("performance_items")
-            if vp_data.get("project_description"):
-                mapping["available_data"].append("project_description")
-
-        # Payment/Remuneration sections
-        if any(keyword in title_lower for keyword in ["vergütung", "payment", "zahlung", "preis"]):
-            if vp_data.get("payment_terms"):
-                mapping["available_data"].append("payment_terms")
-            if lv_data.get("total_amount"):
-                mapping["available_data"].append("total_amount")
-            if lv_data.get("subtotal"):
-                mapping["available_data"].append("subtotal")
-
-        # Parties sections
-        if any(keyword in title_lower for keyword in ["partei", "parties", "vertragspartner"]):
-            if vp_data.get("contractor"):
-                mapping["available_data"].append("contractor")
-            if vp_data.get("subcontractor"):
-                mapping["available_data"].append("subcontractor")
-
-        # Dates/Timeline sections
-        if any(keyword in title_lower for keyword in ["frist", "termin", "deadline", "date", "zeit"]):
-            if vp_data.get("contract_start_date"):
-                mapping["available_data"].append("contract_start_date")
-            if vp_data.get("contract_end_date"):
-                mapping["available_data"].append("contract_end_date")
-            if vp_data.get("negotiation_date"):
-                mapping["available_data"].append("negotiation_date")
-
-        # Project info sections
-        if any(keyword in title_lower for keyword in ["projekt", "project", "bauvorhaben"]):
-            if vp_data.get("project_name"):
-                mapping["available_data"].append("project_name")
-            if vp_data.get("project_location"):
-                mapping["available_data"].append("project_location")
-            if vp_data.get("project_description"):
-                mapping["available_data"].append("project_description")
-
-        # Quality/Standards sections
-        if any(keyword in title_lower for keyword in ["qualität", "quality", "standard"]):
-            if vp_data.get("quality_standards"):
-                mapping["available_data"].append("quality_standards")
-
-        # Warranty sections
-        if any(keyword in title_lower for keyword in ["gewährleistung", "warranty", "mängel"]):
-            if vp_data.get("warranty_period_months"):
-                mapping["available_data"].append("warranty_period_months")
-
-        # Insurance sections
-        if any(keyword in title_lower for keyword in ["versicherung", "insurance", "haftung"]):
-            if vp_data.get("insurance_requirements"):
-                mapping["available_data"].append("insurance_requirements")
+        for keywords, fields in SECTION_RULES:
+            if any(keyword in title_lower for keyword in keywords):
+                for source, field in fields:
+                    if data_sources[source].get(field):
+                        mapping["available_data"].append(field)
 
         # Calculate completeness (rough estimate)
         if len(mapping["available_data"]) > 0:
@@ -117,7 +97,7 @@ def content_mapper_node(state: ContractDraftingState) -> Dict[str, Any]:
 
     # Calculate overall data availability
     total_sections = len(section_mappings)
-    sections_with_data = sum(1 for m in section_mappings.values() if len(m["available_data"]) > 0)
+    sections_with_data = sum(1 for m in section_mappings.values() if m["available_data"])
 
     updates["messages"].append({
         "role": "system",
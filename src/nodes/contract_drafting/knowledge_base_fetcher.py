@@ -1,10 +1,75 @@
 """Knowledge base fetcher node for retrieving historical contracts and clauses."""
 
+import asyncio
+import importlib.util
 import os
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from src.models.contract_drafting_state import ContractDraftingState
 
 
+# Checked once; the (slow) supabase import itself happens on first use
+_SUPABASE_AVAILABLE = importlib.util.find_spec("supabase") is not None
+
+
+@lru_cache(maxsize=4)
+def _get_supabase_client(supabase_url: str, supabase_key: str):
+    """Supabase client per credentials, reused so its HTTP connections are pooled."""
+    from supabase import create_client
+
+    return create_client(supabase_url, supabase_key)
+
+
+def _related_codes(contract_type_data: Dict[str, Any], contract_type_code: str) -> List[str]:
+    """
+    The contract type code followed by its ancestors, nearest first.
+
+    Ancestors come from the type's path, e.g.
+    "SUBCONTRACT.SERVICE_SUBCONTRACTS.SITE_MANAGEMENT_SUPPORT.SITE_SUPERVISION".
+    """
+    ancestors = (contract_type_data or {}).get("path", "").split(".")[:-1]
+    return list(dict.fromkeys([contract_type_code, *reversed(ancestors)]))
+
+
+def _fetch_table(supabase, table: str, codes: List[str], limit: Optional[int], label: str) -> List[Dict[str, Any]]:
+    """
+    Rows of a knowledge base table for the contract type codes; [] on failure.
+
+    Rows of the contract type itself (codes[0]) are fetched first, exactly as
+    before. Only if they leave slots free (or, without a limit, none exist)
+    are the ancestors fetched, in one IN query, nearest code first. Without
+    a limit, only the nearest ancestor that has rows is used.
+    """
+    try:
+        query = supabase.table(table).select("*").eq("contract_type_code", codes[0])
+        if limit is not None:
+            query = query.limit(limit)
+        rows = query.execute().data or []
+
+        ancestors = codes[1:]
+        remaining = None if limit is None else limit - len(rows)
+        if not ancestors:
+            return rows
+        if (limit is None and rows) or (remaining is not None and remaining <= 0):
+            return rows
+
+        query = supabase.table(table).select("*").in_("contract_type_code", ancestors)
+        if remaining is not None:
+            query = query.limit(remaining)
+        ancestor_rows = query.execute().data or []
+    except Exception as e:
+        print(f"⚠️ Could not fetch {label}: {e}")
+        return []
+
+    rank = {code: i for i, code in enumerate(ancestors)}
+    ancestor_rows.sort(key=lambda row: rank.get(row.get("contract_type_code"), len(ancestors)))
+    if limit is None and ancestor_rows:
+        nearest = ancestor_rows[0].get("contract_type_code")
+        ancestor_rows = [row for row in ancestor_rows if row.get("contract_type_code") == nearest]
+    return rows + ancestor_rows
+
+
 def knowledge_base_fetcher_node(state: ContractDraftingState) -> Dict[str, Any]:
     """
     Fetch relevant contracts, clauses, and structures from Supabase.
@@ -42,58 +107,41 @@ def knowledge_base_fetcher_node(state: ContractDraftingState) -> Dict[str, Any]:
             })
             return updates
 
-        # Import here to avoid errors if supabase package not installed
-        from supabase import create_client, Client
+        if not _SUPABASE_AVAILABLE:
+            print("⚠️ Supabase package not installed")
+            updates["messages"].append({
+                "role": "system",
+                "content": "⚠️ Knowledge base library not available - proceeding without historical examples"
+            })
+            return updates
 
-        # Initialize Supabase client
-        supabase: Client = create_client(supabase_url, supabase_key)
+        supabase = _get_supabase_client(supabase_url, supabase_key)
 
         contract_type_code = state.get("contract_type_code")
         project_description = state.get("project_description", "")
 
-        # 1. Fetch similar contracts by type
-        try:
-            contracts_response = supabase.table("contracts") \
-                .select("*") \
-                .eq("contract_type_code", contract_type_code) \
-                .limit(5) \
-                .execute()
-
-            updates["retrieved_contracts"] = contracts_response.data or []
-        except Exception as e:
-            print(f"⚠️ Could not fetch contracts: {e}")
-            updates["retrieved_contracts"] = []
-
-        # 2. Fetch example clauses for this contract type
-        try:
-            clauses_response = supabase.table("clauses") \
-                .select("*") \
-                .eq("contract_type_code", contract_type_code) \
-                .limit(20) \
-                .execute()
-
-            updates["retrieved_clauses"] = clauses_response.data or []
-        except Exception as e:
-            print(f"⚠️ Could not fetch clauses: {e}")
-            updates["retrieved_clauses"] = []
-
-        # 3. Fetch contract structures
-        try:
-            structures_response = supabase.table("contract_structures") \
-                .select("*") \
-                .eq("contract_type_code", contract_type_code) \
-                .execute()
-
-            updates["contract_structures"] = structures_response.data or []
-        except Exception as e:
-            print(f"⚠️ Could not fetch structures: {e}")
-            updates["contract_structures"] = []
+        # Similar contracts, example clauses and structures are independent
+        # queries - run them concurrently instead of one round-trip after another
+        queries = {
+            "retrieved_contracts": ("contracts", 5, "contracts"),
+            "retrieved_clauses": ("clauses", 20, "clauses"),
+            "contract_structures": ("contract_structures", None, "structures"),
+        }
+        codes = _related_codes(state.get("contract_type_data", {}), contract_type_code)
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {
+                key: executor.submit(_fetch_table, supabase, table, codes, limit, label)
+                for key, (table, limit, label) in queries.items()
+            }
+        for key, future in futures.items():
+            updates[key] = future.result()
 
         # 4. Optional: Semantic search by project description
         # If you have embeddings set up in the future
         if project_description and False:  # Disabled for now
             try:
-                # embedding = get_embedding(project_description)
+                # from src.core.semantic_cache import embed_text
+                # embedding = embed_text(project_description)  # cached per description
                 # semantic_results = supabase.rpc("match_contracts", {
                 #     "query_embedding": embedding,
                 #     "match_threshold": 0.7,
@@ -111,14 +159,6 @@ def knowledge_base_fetcher_node(state: ContractDraftingState) -> Dict[str, Any]:
                       f"{len(updates['contract_structures'])} structures"
         })
 
-    except ImportError:
-        # Supabase package not installed
-        print("⚠️ Supabase package not installed")
-        updates["messages"].append({
-            "role": "system",
-            "content": "⚠️ Knowledge base library not available - proceeding without historical examples"
-        })
-
     except Exception as e:
         # Log the error but don't fail the workflow
         print(f"⚠️ Knowledge base fetch failed: {str(e)}")
@@ -129,3 +169,11 @@ def knowledge_base_fetcher_node(state: ContractDraftingState) -> Dict[str, Any]:
         # Empty defaults already set above
 
     return updates
+
+
+async def aknowledge_base_fetcher_node(state: ContractDraftingState) -> Dict[str, Any]:
+    """
+    Async variant of knowledge_base_fetcher_node.
+    Runs the blocking Supabase queries in a worker thread.
+    """
+    return await asyncio.to_thread(knowledge_base_fetcher_node, state)
@@ -1,28 +1,86 @@
 """Output formatter node for generating final contract files."""
 
+import asyncio
+import copy
+import io
 import os
+import re
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, List, Tuple, Union
 from docx import Document
+from docx.document import Document as DocumentType
 from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
+from src.core.json_utils import dumps_indented
 from src.models.contract_drafting_state import ContractDraftingState
 
 
-def output_formatter_node(state: ContractDraftingState) -> Dict[str, Any]:
+_REVIEW_RE = re.compile(r"\[(?:PRÜFUNG ERFORDERLICH|REVIEW NEEDED):")
+
+
+def _iter_paragraphs(text: str):
+    """Yield the blank-line separated blocks of text, like text.split('\\n\\n') but lazily."""
+    start = 0
+    end = text.find("\n\n")
+    while end != -1:
+        yield text[start:end]
+        start = end + 2
+        end = text.find("\n\n", start)
+    yield text[start:]
+
+
+@lru_cache(maxsize=None)
+def _make_dir(abs_path: str) -> None:
+    """Create an output directory once per process (see _write_file for recovery)."""
+    os.makedirs(abs_path, exist_ok=True)
+
+
+def _ensure_dir(path: str) -> None:
+    """Create an output directory; memoized on the absolute path, so a cwd change is noticed."""
+    _make_dir(os.path.abspath(path))
+
+
+@lru_cache(maxsize=1)
+def _template_document() -> DocumentType:
     """
-    Format and export contract.
+    Empty document with the page setup applied, built once per process.
+    Callers work on a deepcopy (cheaper than Document() + page setup).
+    """
+    doc = Document()
 
-    Generates:
-    - TXT version
-    - DOCX version with formatting
-    - Quality report
+    # Set margins
+    for section in doc.sections:
+        section.top_margin = Inches(1)
+        section.bottom_margin = Inches(1)
+        section.left_margin = Inches(1)
+        section.right_margin = Inches(1)
+
+    return doc
+
+
+def _write_file(path: str, data: Union[bytes, memoryview]) -> None:
+    """Write an encoded output file in a single call."""
+    # Buffered writer on purpose: a raw (buffering=0) write may be partial,
+    # and large payloads bypass the buffer anyway
+    try:
+        f = open(path, "wb")
+    except FileNotFoundError:
+        # Directory removed since _make_dir memoized it (long-lived process)
+        _make_dir.cache_clear()
+        _ensure_dir(os.path.dirname(path) or ".")
+        f = open(path, "wb")
+    with f:
+        f.write(data)
 
-    Args:
-        state: Current workflow state
+
+def _prepare_outputs(state: ContractDraftingState) -> Tuple[Dict[str, Any], List[Tuple[str, Union[bytes, memoryview]]]]:
+    """
+    Build the TXT, DOCX and report payloads in memory.
 
     Returns:
-        Updates to state with output file paths
+        (state updates, [(path, bytes), ...] still to be written)
     """
     print("📄 Formatting output...")
 
@@ -37,30 +95,22 @@ def output_formatter_node(state: ContractDraftingState) -> Dict[str, Any]:
     quality_report = state.get("quality_report", {})
     consistency_issues = state.get("consistency_issues", [])
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # One timestamp for file names, DOCX metadata and the report
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     output_dir = "data/output"
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
 
     # 1. Save text version
     txt_filename = f"contract_{contract_type_data.get('code', 'draft')}_{timestamp}.txt"
     txt_path = os.path.join(output_dir, txt_filename)
 
-    with open(txt_path, "w", encoding="utf-8") as f:
-        f.write(contract_draft)
-
+    files = [(txt_path, contract_draft.encode("utf-8"))]
     updates["output_files"]["txt"] = txt_path
 
     # 2. Generate DOCX
     try:
-        doc = Document()
-
-        # Set margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
+        doc = copy.deepcopy(_template_document())
 
         # Title
         title = doc.add_heading(contract_type_data.get('name_de', contract_type_data.get('name')), 0)
@@ -69,67 +119,87 @@ def output_formatter_node(state: ContractDraftingState) -> Dict[str, Any]:
         # Metadata
         metadata_para = doc.add_paragraph()
         metadata_para.add_run(f"Vertragstyp: {contract_type_data.get('name')}\n").bold = True
-        metadata_para.add_run(f"Code: {contract_type_data.get('code')}\n")
-        metadata_para.add_run(f"Generiert: {datetime.now().strftime('%d.%m.%Y %H:%M')}\n")
-        metadata_para.add_run(f"Qualitätsscore: {quality_report.get('score', 0):.1f}/100")
+        # Unformatted lines share one run
+        metadata_para.add_run(
+            f"Code: {contract_type_data.get('code')}\n"
+            f"Generiert: {now.strftime('%d.%m.%Y %H:%M')}\n"
+            f"Qualitätsscore: {quality_report.get('score', 0):.1f}/100"
+        )
         metadata_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         doc.add_page_break()
 
+        # Everything below is inserted before a trailing sentinel paragraph:
+        # doc.add_paragraph() searches the body for the section properties on
+        # every call (quadratic in the paragraph count), addprevious() is O(1)
+        sentinel = doc.add_paragraph()
+
+        def add_paragraph(text: str = "", style: str = None):
+            return sentinel.insert_paragraph_before(text, style)
+
+        def add_heading(text: str, level: int):
+            return add_paragraph(text, f"Heading {level}")
+
+        def add_page_break():
+            add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+
         # Add contract sections
-        sections = contract_draft.split('\n\n')
-        for para_text in sections:
-            if not para_text.strip():
+        heading_size, body_size = Pt(14), Pt(11)
+        for para_text in _iter_paragraphs(contract_draft):
+            stripped = para_text.strip()
+            if not stripped:
                 continue
 
-            # Check if it's a section header (starts with §)
-            if para_text.strip().startswith('§'):
+            first = stripped[0]
+            if first == '§':
                 # Section heading
-                heading = doc.add_heading(para_text.strip(), level=1)
-                heading_run = heading.runs[0]
-                heading_run.font.size = Pt(14)
-            elif para_text.strip().startswith('==='):
+                heading = add_heading(stripped, level=1)
+                heading.runs[0].font.size = heading_size
+            elif stripped.startswith(('===', '---')):
                 # Separator - skip
                 continue
-            elif para_text.strip().startswith('---'):
-                # Subsection separator - skip
-                continue
             else:
                 # Regular paragraph
-                para = doc.add_paragraph(para_text.strip())
-                para_run = para.runs[0] if para.runs else None
-                if para_run:
-                    para_run.font.size = Pt(11)
+                para = add_paragraph(stripped)
+                if para.runs:
+                    para.runs[0].font.size = body_size
 
                 # Highlight review markers
-                if "[PRÜFUNG ERFORDERLICH:" in para_text or "[REVIEW NEEDED:" in para_text:
+                if _REVIEW_RE.search(stripped):
                     para.runs[0].font.highlight_color = 3  # Yellow highlight
 
         # Add quality summary page
-        doc.add_page_break()
-        doc.add_heading("Qualitätsbericht / Quality Report", level=1)
+        add_page_break()
+        add_heading("Qualitätsbericht / Quality Report", level=1)
 
-        quality_para = doc.add_paragraph()
+        quality_para = add_paragraph()
         quality_para.add_run(f"Gesamtscore: {quality_report.get('score', 0):.1f}/100\n").bold = True
-        quality_para.add_run(f"Bewertung: {quality_report.get('level', 'N/A')}\n\n")
-        quality_para.add_run(f"Generierte Abschnitte: {quality_report.get('sections_generated', 0)}/{quality_report.get('sections_required', 0)}\n")
-        quality_para.add_run(f"Vertragslänge: {quality_report.get('contract_length', 0)} Zeichen\n")
-        quality_para.add_run(f"Datennutzung: {quality_report.get('data_usage_ratio', 0)*100:.0f}%\n")
+        quality_para.add_run(
+            f"Bewertung: {quality_report.get('level', 'N/A')}\n\n"
+            f"Generierte Abschnitte: {quality_report.get('sections_generated', 0)}/{quality_report.get('sections_required', 0)}\n"
+            f"Vertragslänge: {quality_report.get('contract_length', 0)} Zeichen\n"
+            f"Datennutzung: {quality_report.get('data_usage_ratio', 0)*100:.0f}%\n"
+        )
 
         if consistency_issues:
-            doc.add_heading("Gefundene Probleme / Issues Found", level=2)
+            add_heading("Gefundene Probleme / Issues Found", level=2)
 
-            for issue in consistency_issues[:10]:  # Limit to first 10
-                issue_para = doc.add_paragraph(style='List Bullet')
+            for issue in islice(consistency_issues, 10):  # Limit to first 10
+                issue_para = add_paragraph(style='List Bullet')
                 severity = issue.get('severity', 'unknown')
                 message = issue.get('message', 'Unknown issue')
                 issue_para.add_run(f"[{severity.upper()}] ").bold = True
                 issue_para.add_run(message)
 
+        sentinel._element.getparent().remove(sentinel._element)
+
         # Save DOCX
         docx_filename = f"contract_{contract_type_data.get('code', 'draft')}_{timestamp}.docx"
         docx_path = os.path.join(output_dir, docx_filename)
-        doc.save(docx_path)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        # getbuffer() exposes the serialized archive without copying it
+        files.append((docx_path, buffer.getbuffer()))
 
         updates["output_files"]["docx"] = docx_path
 
@@ -141,17 +211,16 @@ def output_formatter_node(state: ContractDraftingState) -> Dict[str, Any]:
         })
 
     # 3. Save quality report as JSON
-    import json
     report_filename = f"quality_report_{timestamp}.json"
     report_path = os.path.join(output_dir, report_filename)
 
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "quality_report": quality_report,
-            "consistency_issues": consistency_issues,
-            "contract_type": contract_type_data.get("code"),
-            "generated_at": datetime.now().isoformat()
-        }, f, indent=2, ensure_ascii=False)
+    report = dumps_indented({
+        "quality_report": quality_report,
+        "consistency_issues": consistency_issues,
+        "contract_type": contract_type_data.get("code"),
+        "generated_at": now.isoformat()
+    })
+    files.append((report_path, report.encode("utf-8")))
 
     updates["output_files"]["report"] = report_path
     updates["output_path"] = txt_path  # Primary output
@@ -167,4 +236,36 @@ def output_formatter_node(state: ContractDraftingState) -> Dict[str, Any]:
 
     updates["processing_status"] = "completed"
 
+    return updates, files
+
+
+def output_formatter_node(state: ContractDraftingState) -> Dict[str, Any]:
+    """
+    Format and export contract.
+
+    Generates:
+    - TXT version
+    - DOCX version with formatting
+    - Quality report
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Updates to state with output file paths
+    """
+    updates, files = _prepare_outputs(state)
+    for path, data in files:
+        _write_file(path, data)
+    return updates
+
+
+async def aoutput_formatter_node(state: ContractDraftingState) -> Dict[str, Any]:
+    """
+    Async variant of output_formatter_node.
+    Builds the documents in a worker thread, then writes the three files
+    concurrently.
+    """
+    updates, files = await asyncio.to_thread(_prepare_outputs, state)
+    await asyncio.gather(*(asyncio.to_thread(_write_file, path, data) for path, data in files))
     return updates
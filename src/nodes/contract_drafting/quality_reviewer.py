@@ -1,9 +1,19 @@
 """Quality reviewer node for assessing contract quality."""
 
+import re
+from collections import Counter
 from typing import Dict, Any
 from src.models.contract_drafting_state import ContractDraftingState
 
 
+# Error and review markers, found in one scan per section
+_MARKER_RE = re.compile(r"\[(FEHLER|ERROR|PRÜFUNG|REVIEW)")
+_ERROR_MARKERS = frozenset({"FEHLER", "ERROR"})
+
+# Score deduction per consistency issue
+SEVERITY_PENALTIES = {"critical": 15, "high": 10, "medium": 5}
+
+
 def quality_reviewer_node(state: ContractDraftingState) -> Dict[str, Any]:
     """
     Review contract quality.
@@ -36,14 +46,15 @@ def quality_reviewer_node(state: ContractDraftingState) -> Dict[str, Any]:
     # Start with perfect score
     quality_score = 100.0
 
-    # 1. Penalize for consistency issues
+    # 1. Penalize for consistency issues (one pass: counts + critical list)
+    severity_counts = Counter()
+    critical_issues = []
     for issue in consistency_issues:
-        if issue["severity"] == "critical":
-            quality_score -= 15
-        elif issue["severity"] == "high":
-            quality_score -= 10
-        elif issue["severity"] == "medium":
-            quality_score -= 5
+        severity = issue["severity"]
+        severity_counts[severity] += 1
+        if severity == "critical":
+            critical_issues.append(issue)
+    quality_score -= sum(severity_counts[severity] * weight for severity, weight in SEVERITY_PENALTIES.items())
 
     # 2. Penalize for short contract
     if len(contract_draft) < 500:
@@ -58,10 +69,7 @@ def quality_reviewer_node(state: ContractDraftingState) -> Dict[str, Any]:
     quality_score -= missing_sections * 15
 
     # 4. Reward for data usage
-    sections_with_data = sum(
-        1 for mapping in section_mappings.values()
-        if len(mapping.get("available_data", [])) > 0
-    )
+    sections_with_data = sum(1 for mapping in section_mappings.values() if mapping.get("available_data"))
     data_usage_ratio = sections_with_data / max(1, len(section_mappings))
     quality_bonus = data_usage_ratio * 10
     quality_score += quality_bonus
@@ -75,12 +83,14 @@ def quality_reviewer_node(state: ContractDraftingState) -> Dict[str, Any]:
         section_num = section["section_number"]
         section_text = generated_sections.get(section_num, "")
 
+        markers = {match.group(1) for match in _MARKER_RE.finditer(section_text)}
+
         score = 100
         if not section_text:
             score = 0
-        elif "[FEHLER" in section_text or "[ERROR" in section_text:
+        elif markers & _ERROR_MARKERS:
             score = 20
-        elif "[PRÜFUNG" in section_text or "[REVIEW" in section_text:
+        elif markers:
             score = 60
         elif len(section_text) < 100:
             score = 50
@@ -102,7 +112,7 @@ def quality_reviewer_node(state: ContractDraftingState) -> Dict[str, Any]:
         "score": round(quality_score, 1),
         "level": quality_level,
         "issues_count": len(consistency_issues),
-        "critical_issues": [i for i in consistency_issues if i["severity"] == "critical"],
+        "critical_issues": critical_issues,
         "sections_generated": len(generated_sections),
         "sections_required": len(outline),
         "contract_length": len(contract_draft),
@@ -1,11 +1,22 @@
 """Structure analyzer node for building contract outline."""
 
 import json
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+from src.core import json_utils
 from src.core.llm_clients import get_llm_client
 from src.models.contract_drafting_state import ContractDraftingState
 
 
+_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=128)
+def _required_sections_json(required_sections: Tuple[str, ...]) -> str:
+    """Prompt JSON of a contract type's required sections (static per type)."""
+    return json_utils.dumps_indented(list(required_sections))
+
+
 def structure_analyzer_node(state: ContractDraftingState) -> Dict[str, Any]:
     """
     Analyze contract structures and build outline.
@@ -41,10 +52,10 @@ def structure_analyzer_node(state: ContractDraftingState) -> Dict[str, Any]:
     prompt = f"""Analyze and create a contract outline for: {contract_type_data.get('name')}
 
 Required Sections (mandatory):
-{json.dumps(required_sections, indent=2, ensure_ascii=False)}
+{_required_sections_json(tuple(required_sections or ()))}
 
 {"Historical Structures (examples):" if retrieved_structures else "No historical data available."}
-{json.dumps(retrieved_structures[:3], indent=2, ensure_ascii=False) if retrieved_structures else ""}
+{json_utils.dumps_indented(retrieved_structures[:3]) if retrieved_structures else ""}
 
 Project Description:
 {project_description}
@@ -87,16 +98,14 @@ Example format:
             {"role": "user", "content": prompt}
         ])
 
-        # Parse JSON response
-        outline_text = response.content.strip()
-
-        # Remove markdown code blocks if present
-        if "```json" in outline_text:
-            outline_text = outline_text.split("```json")[1].split("```")[0]
-        elif "```" in outline_text:
-            outline_text = outline_text.split("```")[1].split("```")[0]
-
-        contract_outline = json.loads(outline_text.strip())
+        # Parse JSON response: decode the array in place, starting after a
+        # markdown fence if present; text after the array is ignored
+        outline_text = response.content
+        fence = outline_text.find("```")
+        start = outline_text.find("[", fence if fence != -1 else 0)
+        if start == -1:
+            raise ValueError("Outline must be a list")
+        contract_outline, _ = _DECODER.raw_decode(outline_text, start)
 
         # Validate outline
         if not isinstance(contract_outline, list):
@@ -2,7 +2,9 @@
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Any
+from src.core import json_utils
 from src.models.contract_drafting_state import ContractDraftingState
 
 
@@ -33,11 +35,7 @@ def user_input_handler_node(state: ContractDraftingState) -> Dict[str, Any]:
         })
         return updates
 
-    contract_types = load_contract_types()
-    contract_type_data = next(
-        (ct for ct in contract_types if ct["id"] == contract_type_id),
-        None
-    )
+    contract_type_data = _contract_types_by_id().get(contract_type_id)
 
     if not contract_type_data:
         updates["errors"] = [f"Contract type {contract_type_id} not found"]
@@ -72,15 +70,19 @@ def user_input_handler_node(state: ContractDraftingState) -> Dict[str, Any]:
             "content": "⚠️ No documents uploaded - contract will be generated from contract type template only"
         })
     else:
-        # Map documents to pdf_path and excel_path for existing extractors
+        # Map documents to pdf_path(s) and excel_path for existing extractors
+        pdf_paths = []
         for doc in uploaded_docs:
             doc_type = doc.get("type", "").lower()
             doc_path = doc.get("path", "")
 
             if doc_type == "verhandlungsprotokoll" or doc_path.endswith(('.pdf', '.docx', '.txt')):
                 updates["pdf_path"] = doc_path
+                pdf_paths.append(doc_path)
             elif doc_type == "leistungsverzeichnis" or doc_path.endswith(('.xlsx', '.xls', '.csv')):
                 updates["excel_path"] = doc_path
+        if pdf_paths:
+            updates["pdf_paths"] = pdf_paths
 
         updates["messages"].append({
             "role": "system",
@@ -99,8 +101,9 @@ def user_input_handler_node(state: ContractDraftingState) -> Dict[str, Any]:
     return updates
 
 
+@lru_cache(maxsize=1)
 def load_contract_types():
-    """Load contract types from JSON file."""
+    """Load contract types from JSON file (read once per process; don't mutate)."""
     # Get the project root directory
     current_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
@@ -108,10 +111,16 @@ def load_contract_types():
 
     try:
         with open(json_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            return json_utils.loads(f.read())
     except FileNotFoundError:
         print(f"⚠️ Contract types file not found at {json_path}")
         return []
     except json.JSONDecodeError as e:
         print(f"⚠️ Error parsing contract types JSON: {e}")
         return []
+
+
+@lru_cache(maxsize=1)
+def _contract_types_by_id() -> Dict[str, Dict[str, Any]]:
+    """Contract types indexed by id."""
+    return {ct["id"]: ct for ct in load_contract_types()}
@@ -0,0 +1,24 @@
+"""Shared helpers for the contract drafting nodes."""
+
+from typing import Any, Dict
+
+
+def party_name(vp_data: Dict[str, Any], role: str) -> str:
+    """
+    Name of a contract party from the Verhandlungsprotokoll data.
+
+    The party may be a plain dict or a ContractParty model.
+
+    Args:
+        vp_data: Verhandlungsprotokoll data
+        role: "contractor" or "subcontractor"
+
+    Returns:
+        The party name, or "" if the party or its name is missing
+    """
+    party = vp_data.get(role)
+    if not party:
+        return ""
+    if isinstance(party, dict):
+        return party.get("name") or ""
+    return getattr(party, "name", "") or ""
@@ -1,11 +1,38 @@
 """Contract generator node for creating contract draft from merged data."""
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from src.models.state import ContractState
 
 
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
+
+
+@lru_cache(maxsize=1)
+def _get_template() -> Template:
+    """Contract template, loaded and compiled once per process."""
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # Templates ship with the code; skip the per-render mtime check
+        auto_reload=False
+    )
+    return env.get_template("contract_template.jinja2")
+
+
+def _first_lines(text: str, count: int) -> str:
+    """First count lines of text, without splitting the whole string."""
+    end = -1
+    for _ in range(count):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text
+    return text[:end]
+
+
 def contract_generator_node(state: ContractState) -> Dict[str, Any]:
     """
     Generate contract draft using Jinja2 template and merged data.
@@ -27,16 +54,7 @@ def contract_generator_node(state: ContractState) -> Dict[str, Any]:
         return updates
 
     try:
-        # Setup Jinja2 environment
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
-        env = Environment(
-            loader=FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-
-        # Load template
-        template = env.get_template("contract_template.jinja2")
+        template = _get_template()
 
         # Render contract
         contract_draft = template.render(**merged_data)
@@ -48,8 +66,7 @@ def contract_generator_node(state: ContractState) -> Dict[str, Any]:
         })
 
         # Generate summary
-        summary_lines = contract_draft.split('\n')[:50]  # First 50 lines for preview
-        preview = '\n'.join(summary_lines[:10]) + "\n...\n[Contract continues...]"
+        preview = _first_lines(contract_draft, 10) + "\n...\n[Contract continues...]"
 
         updates["messages"].append({
             "role": "system",
@@ -6,6 +6,17 @@ from src.models.state import ContractState
 from src.models.contract import ContractData, ContractParty, PaymentTerms
 
 
+# Placeholder parties for excel-only runs; immutable, so one instance is shared
+_PLACEHOLDER_CONTRACTOR = ContractParty(
+    name="[Auftraggeber - Bitte ergänzen]",
+    address="[Adresse - Bitte ergänzen]"
+)
+_PLACEHOLDER_SUBCONTRACTOR = ContractParty(
+    name="[Nachunternehmer - Bitte ergänzen]",
+    address="[Adresse - Bitte ergänzen]"
+)
+
+
 def data_merger_node(state: ContractState) -> Dict[str, Any]:
     """
     Merge data from Verhandlungsprotokoll and Leistungsverzeichnis into unified contract data.
@@ -27,41 +38,46 @@ def data_merger_node(state: ContractState) -> Dict[str, Any]:
 
         # If no VP data available (excel-only mode), create placeholder parties
         if not contractor:
-            contractor = ContractParty(
-                name="[Auftraggeber - Bitte ergänzen]",
-                address="[Adresse - Bitte ergänzen]"
-            )
+            contractor = _PLACEHOLDER_CONTRACTOR
             updates["messages"].append({
                 "role": "system",
                 "content": "⚠️ No Verhandlungsprotokoll data - using placeholder contractor information"
             })
 
         if not subcontractor:
-            subcontractor = ContractParty(
-                name="[Nachunternehmer - Bitte ergänzen]",
-                address="[Adresse - Bitte ergänzen]"
-            )
+            subcontractor = _PLACEHOLDER_SUBCONTRACTOR
             updates["messages"].append({
                 "role": "system",
                 "content": "⚠️ No Verhandlungsprotokoll data - using placeholder subcontractor information"
             })
 
         # Ensure contractor and subcontractor are ContractParty objects
+        # (instances from the extractors are already validated and reused as-is;
+        # dicts are dumps of those, e.g. restored from a checkpoint, so they
+        # are rebuilt without validating again)
         if isinstance(contractor, dict):
-            contractor = ContractParty(**contractor)
+            contractor = ContractParty.model_construct(**contractor)
         if isinstance(subcontractor, dict):
-            subcontractor = ContractParty(**subcontractor)
+            subcontractor = ContractParty.model_construct(**subcontractor)
 
         # Prepare payment terms - use actual data
         payment_terms = vp_data.get("payment_terms")
         if not payment_terms:
             # Create minimal payment terms if missing
-            payment_terms = PaymentTerms(
+            payment_terms = PaymentTerms.model_construct(
                 payment_schedule=vp_data.get("payment_schedule", "To be defined"),
                 payment_deadline_days=30
             )
         if isinstance(payment_terms, dict):
-            payment_terms = PaymentTerms(**payment_terms)
+            payment_terms = PaymentTerms.model_construct(**payment_terms)
+
+        # Read the date once for all defaults
+        today = date.today()
+        try:
+            one_year_later = today.replace(year=today.year + 1)
+        except ValueError:
+            # 29 February -> 28 February of the following year
+            one_year_later = today.replace(year=today.year + 1, day=28)
 
         # Merge data into ContractData structure
         merged_data = {
@@ -76,9 +92,9 @@ def data_merger_node(state: ContractState) -> Dict[str, Any]:
             "project_reference": lv_data.get("project_reference"),
 
             # Dates
-            "contract_date": date.today(),
-            "start_date": vp_data.get("contract_start_date", date.today()),
-            "end_date": vp_data.get("contract_end_date", date(date.today().year + 1, date.today().month, date.today().day)),
+            "contract_date": today,
+            "start_date": vp_data.get("contract_start_date", today),
+            "end_date": vp_data.get("contract_end_date", one_year_later),
 
             # Scope and specifications
             "scope_of_work": vp_data.get("scope_of_work", "[Scope Not Extracted]"),
@@ -104,7 +120,7 @@ def data_merger_node(state: ContractState) -> Dict[str, Any]:
             "attachments": ["Verhandlungsprotokoll.pdf", "Leistungsverzeichnis.xlsx"],
 
             # Metadata
-            "generated_date": date.today(),
+            "generated_date": today,
             "version": "1.0"
         }
 
@@ -1,6 +1,6 @@
 """Document classifier node to route documents to appropriate extractors."""
 
-from typing import Dict, Any, Literal
+from typing import Dict, Any, List, Literal, Union
 from src.models.state import ContractState
 
 
@@ -48,14 +48,19 @@ def document_classifier_node(state: ContractState) -> Dict[str, Any]:
     return updates
 
 
-def route_documents(state: ContractState) -> Literal["document_extractor", "excel_extractor", "both", "error"]:
+def route_documents(
+    state: ContractState,
+) -> Union[List[Literal["document_extractor", "excel_extractor"]], Literal["document_extractor", "excel_extractor", "error"]]:
     """
     Routing function to determine which extractors to run.
+
+    With both documents, both extractors are returned so LangGraph runs
+    them in parallel (their async variants overlap the LLM round-trips).
     """
     status = state.get("processing_status", "")
 
     if status == "both_documents":
-        return "both"
+        return ["document_extractor", "excel_extractor"]
     elif status == "pdf_only":
         return "document_extractor"
     elif status == "excel_only":
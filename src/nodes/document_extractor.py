@@ -1,20 +1,148 @@
 """Document extractor node for processing Verhandlungsprotokoll (supports DOCX, PDF, TXT)."""
 
+import asyncio
+import hashlib
+import mmap
+import multiprocessing
+import os
+import re
 import pdfplumber
 from docx import Document
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import date, datetime
 from src.core.llm_clients import get_llm_client
 from src.models.state import ContractState
 from src.models.contract import VerhandlungsprotokollData, ContractParty, PaymentTerms
-from src.prompts import DOCUMENT_EXTRACTION_PROMPT, FIELD_EXTRACTION_PROMPT_TEMPLATE
+from src.prompts import (
+    DOCUMENT_EXTRACTION_PROMPT,
+    FIELD_EXTRACTION_PROMPT_TEMPLATE,
+    FALLBACK_EXTRACTION_PROMPT_TEMPLATE,
+)
 import json
 
+# Upper bound on concurrent requests for the fallback field extraction batch
+FALLBACK_MAX_CONCURRENCY = 8
+
+# JSON object in an LLM response that may carry extra text
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+# German date, e.g. 01.03.2025
+_DATE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+
+# PDF content hash -> indices of pages that can carry text. Lets repeated runs
+# on the same file skip the per-page resource inspection. Only filled by
+# in-process extraction; entries computed in _extract_files workers are lost.
+_PDF_TEXT_PAGES: Dict[str, Tuple[int, ...]] = {}
+
+
+def _page_may_have_text(page) -> bool:
+    """
+    Check a page's resources for anything that can draw text.
+
+    Scanned pages reference only image XObjects and no fonts; for those
+    extract_text() can't find anything, so they are skipped without parsing
+    their content stream.
+    """
+    from pdfminer.pdftypes import resolve1
+    from pdfminer.psparser import LIT
+
+    resources = resolve1(page.page_obj.resources) or {}
+    if resolve1(resources.get("Font")):
+        return True
+    # Form XObjects may carry their own fonts
+    xobjects = resolve1(resources.get("XObject")) or {}
+    image = LIT("Image")
+    return any(resolve1(xobj).get("Subtype") is not image for xobj in xobjects.values())
+
+
+def _extract_pdf_text(doc_path: str) -> str:
+    """Extract text from a PDF, skipping image-only (scanned) pages."""
+    full_text = ""
+    with open(doc_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        with pdfplumber.open(data) as pdf:
+            text_pages = _PDF_TEXT_PAGES.get(digest)
+            if text_pages is None:
+                text_pages = tuple(i for i, page in enumerate(pdf.pages) if _page_may_have_text(page))
+                _PDF_TEXT_PAGES[digest] = text_pages
+
+            skipped = len(pdf.pages) - len(text_pages)
+            if skipped:
+                print(f"  Skipping {skipped} image-only page(s) without a text layer")
+
+            for i in text_pages:
+                page_text = pdf.pages[i].extract_text()
+                if page_text:
+                    full_text += page_text + "\n"
+    return full_text
+
+
+def _extract_text(doc_path: str) -> str:
+    """Extract the raw text of one document (DOCX, PDF, or TXT)."""
+    full_text = ""
+    if doc_path.endswith('.txt'):
+        # Read text file directly
+        with open(doc_path, 'r', encoding='utf-8') as f:
+            full_text = f.read()
+    elif doc_path.endswith('.docx'):
+        # Extract from Word document
+        doc = Document(doc_path)
+        paragraphs = []
+        for para in doc.paragraphs:
+            if para.text.strip():
+                paragraphs.append(para.text)
+        # Also extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                row_text = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+                if row_text:
+                    paragraphs.append(" | ".join(row_text))
+        full_text = "\n".join(paragraphs)
+    else:
+        # Extract from PDF
+        full_text = _extract_pdf_text(doc_path)
+
+    return full_text
+
+
+def _extract_file(doc_path: str) -> Tuple[str, str, str]:
+    """Extract one file with error isolation; returns (filename, status, text)."""
+    try:
+        return os.path.basename(doc_path), "ok", _extract_text(doc_path)
+    except Exception as e:
+        return os.path.basename(doc_path), f"error: {e}", ""
+
+
+# forkserver where the platform has it (not on Windows), spawn otherwise
+_POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _extract_files(doc_paths: List[str]) -> List[Tuple[str, str, str]]:
+    """
+    Extract several documents in parallel worker processes.
+
+    pdfplumber/python-docx parsing is pure Python and holds the GIL, so
+    processes (not threads) are used, one per file up to the CPU count.
+    Workers come from a forkserver (spawn where unavailable): this runs in
+    a worker thread of a process with live HTTP client threads, where a
+    plain fork() can copy a held lock into the child and deadlock it.
+
+    The pool lives for this call only, so workers start with an empty
+    _PDF_TEXT_PAGES and the page indices they compute are not kept.
+    """
+    workers = min(os.cpu_count() or 1, len(doc_paths))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+    ) as pool:
+        return list(pool.map(_extract_file, doc_paths))
+
 
 def document_extractor_node(state: ContractState) -> Dict[str, Any]:
     """
     Extract data from Verhandlungsprotokoll document (DOCX, PDF, or TXT) using LLM.
     Automatically searches for documents in resource/ folder.
+    Several documents (pdf_paths) are read in parallel and structured together.
     """
     print("📄 Extracting data from Verhandlungsprotokoll...")
 
@@ -23,13 +151,14 @@ def document_extractor_node(state: ContractState) -> Dict[str, Any]:
         "messages": []
     }
 
-    # Try to get path from state first (backward compatibility)
-    doc_path = state.get("pdf_path")
+    # Try to get paths from state first (pdf_path for backward compatibility)
+    doc_paths = list(state.get("pdf_paths") or [])
+    if not doc_paths and state.get("pdf_path"):
+        doc_paths = [state["pdf_path"]]
 
     # If not in state, search resource folder
-    if not doc_path:
+    if not doc_paths:
         import glob
-        import os
 
         # Search patterns for Verhandlungsprotokoll
         patterns = [
@@ -45,11 +174,11 @@ def document_extractor_node(state: ContractState) -> Dict[str, Any]:
         for pattern in patterns:
             files = glob.glob(pattern)
             if files:
-                doc_path = files[0]  # Take first match
-                print(f"  Found document: {os.path.basename(doc_path)}")
+                doc_paths = [files[0]]  # Take first match
+                print(f"  Found document: {os.path.basename(files[0])}")
                 break
 
-    if not doc_path:
+    if not doc_paths:
         updates["messages"].append({
             "role": "system",
             "content": "⚠️ No document file available in resource/ folder, skipping extraction"
@@ -57,33 +186,20 @@ def document_extractor_node(state: ContractState) -> Dict[str, Any]:
         return updates
 
     try:
-        # Extract text from docx, PDF, or text file
-        full_text = ""
-        if doc_path.endswith('.txt'):
-            # Read text file directly
-            with open(doc_path, 'r', encoding='utf-8') as f:
-                full_text = f.read()
-        elif doc_path.endswith('.docx'):
-            # Extract from Word document
-            doc = Document(doc_path)
-            paragraphs = []
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    paragraphs.append(para.text)
-            # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = [cell.text.strip() for cell in row.cells if cell.text.strip()]
-                    if row_text:
-                        paragraphs.append(" | ".join(row_text))
-            full_text = "\n".join(paragraphs)
+        if len(doc_paths) == 1:
+            # Extract text from docx, PDF, or text file
+            full_text = _extract_text(doc_paths[0])
         else:
-            # Extract from PDF
-            with pdfplumber.open(doc_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += page_text + "\n"
+            results = _extract_files(doc_paths)
+            for filename, status, _ in results:
+                if status != "ok":
+                    updates["messages"].append({
+                        "role": "system",
+                        "content": f"⚠️ Could not read {filename}: {status}"
+                    })
+            if all(status != "ok" for _, status, _ in results):
+                raise RuntimeError(f"none of the {len(doc_paths)} documents could be read")
+            full_text = "\n\n".join(text for _, status, text in results if status == "ok")
 
         updates["verhandlungsprotokoll_raw"] = full_text
         updates["messages"].append({
@@ -115,8 +231,7 @@ def document_extractor_node(state: ContractState) -> Dict[str, Any]:
                 response_text = response_text.split("```")[1].split("```")[0]
 
             # Try to find JSON in the response (in case LLM added extra text)
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+            json_match = _JSON_BLOCK_RE.search(response_text)
             if json_match:
                 response_text = json_match.group()
 
@@ -181,46 +296,96 @@ def document_extractor_node(state: ContractState) -> Dict[str, Any]:
     return updates
 
 
+async def adocument_extractor_node(state: ContractState) -> Dict[str, Any]:
+    """
+    Async variant of document_extractor_node.
+    Runs the blocking parse and LLM call in a worker thread so the event loop
+    can progress the other fan-out nodes concurrently.
+    """
+    return await asyncio.to_thread(document_extractor_node, state)
+
+
+# Fields of the combined fallback prompt
+FALLBACK_FIELDS = (
+    "project_name", "project_location",
+    "contractor_name", "contractor_address",
+    "subcontractor_name", "subcontractor_address",
+    "description", "scope", "payment",
+)
+
+
+def _fallback_fields_combined(llm, text: str) -> Optional[Dict[str, str]]:
+    """All fallback fields from one JSON-returning call, or None if unparseable."""
+    try:
+        response = llm.invoke([
+            {"role": "system", "content": "Extract only the requested information. Be concise."},
+            {"role": "user", "content": FALLBACK_EXTRACTION_PROMPT_TEMPLATE(text)}
+        ])
+        json_match = _JSON_BLOCK_RE.search(response.content)
+        data = json.loads(json_match.group()) if json_match else None
+    except (json.JSONDecodeError, AttributeError, TypeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return {field: str(data.get(field) or "").strip() for field in FALLBACK_FIELDS}
+
+
+def _fallback_fields_batched(llm, text: str) -> Dict[str, str]:
+    """Fallback fields from one targeted question each (sent as a concurrent batch)."""
+    field_questions = {
+        "project_name": "What is the project name? Return ONLY the project name, nothing else.",
+        "project_location": "What is the project location/address? Return ONLY the location.",
+        "contractor": "Who is the main contractor (Auftraggeber)? Return name and address only.",
+        "subcontractor": "Who is the subcontractor (Nachunternehmer)? Return name and address only.",
+        "description": "Briefly describe the project scope. Maximum 2 sentences.",
+        "scope": "What work will be performed? Summarize in 2-3 sentences.",
+        "payment": "What are the payment terms? Return in one sentence.",
+    }
+    responses = llm.batch(
+        [
+            [
+                {"role": "system", "content": "Extract only the requested information. Be concise."},
+                {"role": "user", "content": FIELD_EXTRACTION_PROMPT_TEMPLATE(field_name, question, text)}
+            ]
+            for field_name, question in field_questions.items()
+        ],
+        config={"max_concurrency": FALLBACK_MAX_CONCURRENCY},
+    )
+    fields = {
+        field_name: response.content.strip()
+        for field_name, response in zip(field_questions, responses)
+    }
+
+    # Parties come back as "name\naddress"
+    for party in ("contractor", "subcontractor"):
+        parts = fields.pop(party).split('\n')
+        fields[f"{party}_name"] = parts[0] if parts else ""
+        fields[f"{party}_address"] = parts[1] if len(parts) > 1 else ""
+
+    return fields
+
+
 def extract_with_fallback(text: str) -> Dict[str, Any]:
-    """Simpler extraction method using pattern matching and LLM for specific fields."""
-    import re
+    """
+    Simpler extraction method using pattern matching and LLM for specific fields.
 
+    Asks for all fields in one JSON call first; if that response can't be
+    parsed, falls back to one targeted question per field.
+    """
     try:
         llm = get_llm_client()  # Uses default provider from config
 
-        # Extract specific fields with targeted prompts
-        def extract_field(field_name: str, prompt: str) -> str:
-            field_prompt = FIELD_EXTRACTION_PROMPT_TEMPLATE(field_name, prompt, text)
-            response = llm.invoke([
-                {"role": "system", "content": "Extract only the requested information. Be concise."},
-                {"role": "user", "content": field_prompt}
-            ])
-            return response.content.strip()
-
-        # Extract key information with targeted prompts
-        project_name = extract_field("project_name",
-            "What is the project name? Return ONLY the project name, nothing else.")
-
-        project_location = extract_field("project_location",
-            "What is the project location/address? Return ONLY the location.")
-
-        # Extract contractor info
-        contractor_info = extract_field("contractor",
-            "Who is the main contractor (Auftraggeber)? Return name and address only.")
-        contractor_parts = contractor_info.split('\n')
-        contractor_name = contractor_parts[0] if contractor_parts else ""
-        contractor_address = contractor_parts[1] if len(contractor_parts) > 1 else ""
-
-        # Extract subcontractor info
-        subcontractor_info = extract_field("subcontractor",
-            "Who is the subcontractor (Nachunternehmer)? Return name and address only.")
-        subcontractor_parts = subcontractor_info.split('\n')
-        subcontractor_name = subcontractor_parts[0] if subcontractor_parts else ""
-        subcontractor_address = subcontractor_parts[1] if len(subcontractor_parts) > 1 else ""
+        fields = _fallback_fields_combined(llm, text) or _fallback_fields_batched(llm, text)
+
+        project_name = fields["project_name"]
+        project_location = fields["project_location"]
+        contractor_name = fields["contractor_name"]
+        contractor_address = fields["contractor_address"]
+        subcontractor_name = fields["subcontractor_name"]
+        subcontractor_address = fields["subcontractor_address"]
 
         # Try to find dates with regex
-        date_pattern = r'(\d{1,2})\.(\d{1,2})\.(\d{4})'
-        dates = re.findall(date_pattern, text)
+        dates = _DATE_RE.findall(text)
 
         # Use first found date as start, calculate end as 6 months later
         if dates:
@@ -232,26 +397,25 @@ def extract_with_fallback(text: str) -> Dict[str, Any]:
         end_date = date(start_date.year + (1 if start_date.month > 6 else 0),
                         (start_date.month + 6) % 12 or 12, start_date.day)
 
+        # All values are strings built above, so the models are constructed
+        # without validation (the JSON path validates the LLM's output)
         return {
             "project_name": project_name,
             "project_location": project_location,
-            "project_description": extract_field("description",
-                "Briefly describe the project scope. Maximum 2 sentences."),
-            "contractor": ContractParty(
+            "project_description": fields["description"],
+            "contractor": ContractParty.model_construct(
                 name=contractor_name or "[Auftraggeber Name nicht gefunden]",
                 address=contractor_address or "[Auftraggeber Adresse nicht gefunden]"
             ),
-            "subcontractor": ContractParty(
+            "subcontractor": ContractParty.model_construct(
                 name=subcontractor_name or "[Nachunternehmer Name nicht gefunden]",
                 address=subcontractor_address or "[Nachunternehmer Adresse nicht gefunden]"
             ),
             "contract_start_date": start_date,
             "contract_end_date": end_date,
-            "scope_of_work": extract_field("scope",
-                "What work will be performed? Summarize in 2-3 sentences."),
-            "payment_terms": PaymentTerms(
-                payment_schedule=extract_field("payment",
-                    "What are the payment terms? Return in one sentence.") or "Zahlungsbedingungen noch zu definieren",
+            "scope_of_work": fields["scope"],
+            "payment_terms": PaymentTerms.model_construct(
+                payment_schedule=fields["payment"] or "Zahlungsbedingungen noch zu definieren",
                 payment_deadline_days=30
             ),
             "special_agreements": [],
@@ -1,11 +1,51 @@
 """Excel extractor node for processing Leistungsverzeichnis."""
 
-import pandas as pd
-from typing import Dict, Any, List
+import asyncio
+import os
+from typing import Dict, Any, Iterator, List, Tuple
 from datetime import date
 from src.models.state import ContractState
 from src.models.contract import LeistungsverzeichnisData, PerformanceItem
 
+# 19% German VAT, in basis points so totals can be computed in integer cents
+VAT_RATE_BP = 1900
+
+
+def _read_sheet_rows(excel_path: str) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+    """
+    Open the first sheet and return (column names, row iterator).
+
+    .xlsx/.xlsm files are streamed with openpyxl in read-only mode, so only
+    one row is held in memory at a time and styles/formulas are not loaded.
+    Other formats fall back to pandas. The first row is the header; unnamed
+    columns are called "Unnamed: <index>" as pandas does.
+    """
+    if os.path.splitext(excel_path)[1].lower() not in (".xlsx", ".xlsm"):
+        import pandas as pd
+        df = pd.read_excel(excel_path, sheet_name=0, header=0)
+        df.columns = [str(col) for col in df.columns]
+        df = df.astype(object).where(df.notna(), None)
+        return list(df.columns), iter(df.to_dict('records'))
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    rows = workbook.worksheets[0].iter_rows(values_only=True)
+    header = next(rows, ())
+    columns = [
+        str(name) if name is not None else f"Unnamed: {i}"
+        for i, name in enumerate(header)
+    ]
+
+    def records() -> Iterator[Dict[str, Any]]:
+        try:
+            for values in rows:
+                yield dict(zip(columns, values))
+        finally:
+            workbook.close()
+
+    return columns, records()
+
 
 def excel_extractor_node(state: ContractState) -> Dict[str, Any]:
     """
@@ -52,15 +92,13 @@ def excel_extractor_node(state: ContractState) -> Dict[str, Any]:
         return updates
 
     try:
-        # Read Excel file (use the first row as header)
-        df = pd.read_excel(excel_path, sheet_name=0, header=0)
-
-        # Store raw data
-        updates["leistungsverzeichnis_raw"] = df.to_dict('records')
+        # Stream the sheet (first row is the header). Rows are turned into
+        # performance items as they are read; the raw rows are not kept in state.
+        columns, rows = _read_sheet_rows(excel_path)
 
         # Extract performance items
         performance_items = []
-        subtotal = 0.0
+        subtotal_cents = 0  # exact; floats would drift over thousands of rows
 
         # Expected column mappings (adjust based on actual Excel structure)
         column_mappings = {
@@ -75,7 +113,7 @@ def excel_extractor_node(state: ContractState) -> Dict[str, Any]:
         # Find actual column names
         actual_columns = {}
         for key, possible_names in column_mappings.items():
-            for col in df.columns:
+            for col in columns:
                 if any(name.lower() in str(col).lower() for name in possible_names):
                     actual_columns[key] = col
                     break
@@ -83,21 +121,21 @@ def excel_extractor_node(state: ContractState) -> Dict[str, Any]:
         # If we can't find columns, try to infer from data
         if not actual_columns:
             # Assume first 6 columns are: position, description, quantity, unit, unit_price, total_price
-            if len(df.columns) >= 6:
+            if len(columns) >= 6:
                 actual_columns = {
-                    'position': df.columns[0],
-                    'description': df.columns[1],
-                    'quantity': df.columns[2],
-                    'unit': df.columns[3],
-                    'unit_price': df.columns[4],
-                    'total_price': df.columns[5]
+                    'position': columns[0],
+                    'description': columns[1],
+                    'quantity': columns[2],
+                    'unit': columns[3],
+                    'unit_price': columns[4],
+                    'total_price': columns[5]
                 }
 
         # Extract items
-        for index, row in df.iterrows():
+        for index, row in enumerate(rows):
             try:
                 # Skip empty rows
-                if pd.isna(row.get(actual_columns.get('description', df.columns[1]))):
+                if row.get(actual_columns.get('description', columns[1])) is None:
                     continue
 
                 quantity = float(row.get(actual_columns.get('quantity', 1)) or 1)
@@ -115,7 +153,7 @@ def excel_extractor_node(state: ContractState) -> Dict[str, Any]:
                 )
 
                 performance_items.append(item)
-                subtotal += total_price
+                subtotal_cents += round(total_price * 100)
 
             except (ValueError, TypeError) as e:
                 updates["messages"].append({
@@ -124,9 +162,11 @@ def excel_extractor_node(state: ContractState) -> Dict[str, Any]:
                 })
 
         # Calculate totals
-        tax_rate = 0.19  # 19% German VAT
-        tax_amount = round(subtotal * tax_rate, 2)
-        total_amount = round(subtotal + tax_amount, 2)
+        tax_cents = (subtotal_cents * VAT_RATE_BP + 5000) // 10000  # round half up
+        subtotal = subtotal_cents / 100
+        tax_rate = VAT_RATE_BP / 10000
+        tax_amount = tax_cents / 100
+        total_amount = (subtotal_cents + tax_cents) / 100
 
         # Create structured data
         leistungsverzeichnis_data = {
@@ -134,7 +174,7 @@ def excel_extractor_node(state: ContractState) -> Dict[str, Any]:
             "project_reference": state.get("verhandlungsprotokoll_data", {}).get("project_name", "Project"),
             "creation_date": date.today(),
             "performance_items": performance_items,
-            "subtotal": round(subtotal, 2),
+            "subtotal": subtotal,
             "tax_rate": tax_rate,
             "tax_amount": tax_amount,
             "total_amount": total_amount,
@@ -160,3 +200,9 @@ def excel_extractor_node(state: ContractState) -> Dict[str, Any]:
     return updates
 
 
+async def aexcel_extractor_node(state: ContractState) -> Dict[str, Any]:
+    """
+    Async variant of excel_extractor_node.
+    Runs the blocking Excel parse in a worker thread.
+    """
+    return await asyncio.to_thread(excel_extractor_node, state)
@@ -1,8 +1,13 @@
 """Prompts module for contract draft generation."""
 
-from .document_extraction import DOCUMENT_EXTRACTION_PROMPT, FIELD_EXTRACTION_PROMPT_TEMPLATE
+from .document_extraction import (
+    DOCUMENT_EXTRACTION_PROMPT,
+    FIELD_EXTRACTION_PROMPT_TEMPLATE,
+    FALLBACK_EXTRACTION_PROMPT_TEMPLATE,
+)
 
 __all__ = [
     "DOCUMENT_EXTRACTION_PROMPT",
     "FIELD_EXTRACTION_PROMPT_TEMPLATE",
+    "FALLBACK_EXTRACTION_PROMPT_TEMPLATE",
 ]
\ No newline at end of file
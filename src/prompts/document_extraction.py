@@ -79,4 +79,35 @@ def FIELD_EXTRACTION_PROMPT_TEMPLATE(field_name: str, prompt: str, text: str) ->
     Returns:
         The formatted prompt
     """
-    return f"{prompt}\n\nText:\n{text[:2000]}"
\ No newline at end of file
+    return f"{prompt}\n\nText:\n{text[:2000]}"
+
+
+def FALLBACK_EXTRACTION_PROMPT_TEMPLATE(text: str) -> str:
+    """
+    Generate a single prompt asking for all fallback fields at once.
+
+    Args:
+        text: The text to extract from (limited to first 2000 characters)
+
+    Returns:
+        The formatted prompt
+    """
+    return f"""Extract the following fields from the text and return them as one JSON object:
+
+{{
+    "project_name": "Project name only",
+    "project_location": "Project location/address",
+    "contractor_name": "Name of the main contractor (Auftraggeber)",
+    "contractor_address": "Address of the main contractor",
+    "subcontractor_name": "Name of the subcontractor (Nachunternehmer)",
+    "subcontractor_address": "Address of the subcontractor",
+    "description": "Brief project description, maximum 2 sentences",
+    "scope": "Work to be performed, 2-3 sentences",
+    "payment": "Payment terms in one sentence"
+}}
+
+Use an empty string for anything not found in the text.
+Return ONLY the JSON object, no additional text.
+
+Text:
+{text[:2000]}"""